@@ -0,0 +1,103 @@
+import io
+import time
+import zipfile
+
+from docx import Document
+
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+from cocomo import simulate
+from count_loc import measure_sources
+from generate_cocomo_doc import (
+    BODY_SIZE,
+    HEADING_SIZE,
+    PARAGRAPH_STYLES,
+    REPORT_FONT,
+    SOURCE_ROOT,
+    ReportBuilder,
+    build_cocomo_document,
+)
+
+RUNS = 50
+# Appendix-sized tables; cell-by-cell filling is quadratic, so the
+# direct builder stops at DIRECT_TABLE_LIMIT rows
+TABLE_ROWS = (250, 1000, 5000)
+DIRECT_TABLE_LIMIT = 1000
+
+def format_run(run, size=BODY_SIZE, bold=False):
+    run.font.size = size
+    run.font.name = REPORT_FONT
+    if bold:
+        run.font.bold = True
+
+class DirectFormattingBuilder(ReportBuilder):
+    """The original per-run font assignment, kept for comparison"""
+
+    def define_styles(self):
+        pass
+
+    def paragraph(self, text='', style=None):
+        base, alignment, bold = PARAGRAPH_STYLES.get(style, (style, None, False))
+        paragraph = self.doc.add_paragraph(style=base if base != 'Normal' else None)
+        if alignment is not None:
+            paragraph.alignment = alignment
+        if text:
+            format_run(paragraph.add_run(text), bold=bold)
+        return paragraph
+
+    def heading(self, text, level):
+        heading = self.doc.add_heading(text, level=level)
+        if level == 1:
+            format_run(heading.runs[0], HEADING_SIZE, bold=True)
+        return heading
+
+    def table(self, header, rows, text_columns=(), strong_rows=()):
+        table = self.doc.add_table(rows=len(rows) + 1, cols=len(header))
+        table.style = 'Table Grid'
+        for row_index, values in enumerate([header, *rows]):
+            cells = table.rows[row_index].cells
+            for column, text in enumerate(values):
+                cells[column].text = text
+                left = row_index and column in text_columns
+                cells[column].paragraphs[0].alignment = (WD_ALIGN_PARAGRAPH.LEFT if left
+                                                         else WD_ALIGN_PARAGRAPH.CENTER)
+                for run in cells[column].paragraphs[0].runs:
+                    format_run(run, bold=row_index == 0 or row_index - 1 in strong_rows)
+        return table
+
+def measure(builder_class, size, simulation):
+    start = time.perf_counter()
+    for _ in range(RUNS):
+        doc = build_cocomo_document(builder_class, size, simulation)
+        buffer = io.BytesIO()
+        doc.save(buffer)
+    elapsed = (time.perf_counter() - start) / RUNS
+    with zipfile.ZipFile(buffer) as archive:
+        document_size = archive.getinfo('word/document.xml').file_size
+        styles_size = archive.getinfo('word/styles.xml').file_size
+    return elapsed, document_size, styles_size, buffer.tell()
+
+def measure_table(builder_class, row_count):
+    """Seconds to add a per-file LOC listing of row_count rows"""
+    builder = builder_class(Document())
+    rows = [[f'src/pages/page{n}.tsx', 'Frontend', f'{n * 7 % 900:,}', str(n % 40)] for n in range(row_count)]
+    start = time.perf_counter()
+    builder.table(['File', 'Module', 'Code', 'Comment'], rows, text_columns=(0, 1))
+    return time.perf_counter() - start
+
+def main():
+    size = measure_sources(SOURCE_ROOT)
+    simulation = simulate(size.kloc)
+    print(f"{'builder':>8} {'ms/doc':>8} {'document.xml':>13} {'styles.xml':>11} {'docx':>8}")
+    for label, builder_class in (('direct', DirectFormattingBuilder), ('styles', ReportBuilder)):
+        elapsed, document_size, styles_size, package_size = measure(builder_class, size, simulation)
+        print(f"{label:>8} {elapsed * 1000:>8.1f} {document_size:>13} {styles_size:>11} {package_size:>8}")
+
+    print(f"\n{'rows':>8} {'direct ms':>10} {'styles ms':>10}")
+    for row_count in TABLE_ROWS:
+        direct = (f"{measure_table(DirectFormattingBuilder, row_count) * 1000:>10.1f}"
+                  if row_count <= DIRECT_TABLE_LIMIT else f"{'-':>10}")
+        print(f"{row_count:>8} {direct} {measure_table(ReportBuilder, row_count) * 1000:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import time
+
+from docx import Document
+
+from read_docx import HEADING_STYLES
+from text_match import extract_heading_text
+from update_docx import apply_content_mapping, build_section_index
+
+SECTION_LENGTH = 50
+# Every synthetic heading matches, so each section is rewritten
+MAPPING = {"SECTION": "Replacement body text."}
+
+def build_synthetic_document(paragraph_count):
+    """Create a document with a heading every SECTION_LENGTH paragraphs"""
+    doc = Document()
+    for i in range(paragraph_count):
+        if i % SECTION_LENGTH == 0:
+            doc.add_heading(f'Section {i // SECTION_LENGTH}', level=2)
+        else:
+            doc.add_paragraph(f'Body paragraph {i} of the synthetic report.')
+    return doc
+
+def is_heading(paragraph):
+    """Check if paragraph is a heading"""
+    return paragraph.style.name in HEADING_STYLES
+
+def legacy_replace(doc, mapping):
+    """The original doc.paragraphs loop, kept for comparison"""
+    i = 0
+    while i < len(doc.paragraphs):
+        para = doc.paragraphs[i]
+        if is_heading(para) and para.text.strip():
+            heading_text = extract_heading_text(para.text)
+            key = next((key for key in mapping
+                        if key in heading_text or heading_text in key), None)
+            if key is not None:
+                current_heading_para = para
+                i += 1
+                while i < len(doc.paragraphs):
+                    next_para = doc.paragraphs[i]
+                    if is_heading(next_para) and next_para.text.strip():
+                        break
+                    p = next_para._element
+                    p.getparent().remove(p)
+                new_para = current_heading_para.insert_paragraph_before(mapping[key])
+                current_heading_para._element.addnext(new_para._element)
+                new_para.style = 'Body Text'
+        i += 1
+
+def indexed_replace(doc, mapping):
+    """Section-index path used by update_docx.py"""
+    apply_content_mapping(doc, build_section_index(doc), mapping)
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+def main():
+    print(f"{'paragraphs':>10} {'engine':>8} {'seconds':>9} {'us/para':>9}")
+    for count in (1_000, 2_000):
+        elapsed = time_call(legacy_replace, build_synthetic_document(count), MAPPING)
+        print(f"{count:>10} {'legacy':>8} {elapsed:>9.3f} {elapsed / count * 1e6:>9.1f}")
+    for count in (2_000, 5_000, 10_000, 50_000):
+        elapsed = time_call(indexed_replace, build_synthetic_document(count), MAPPING)
+        print(f"{count:>10} {'index':>8} {elapsed:>9.3f} {elapsed / count * 1e6:>9.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from lxml import etree
+
+from docx_package import DocxPackage, main_document_name, repackage_docx, write_atomic
+from read_docx import (
+    W_BODY,
+    W_P,
+    W_T,
+    iter_runs,
+    paragraph_style_id,
+    paragraph_text,
+    read_styles,
+    run_item_text,
+)
+from text_match import PatternAutomaton, on_word_boundary
+
+# Canonical spelling -> other spellings seen in the reports and docs.
+# Different capitalizations of the canonical term are caught without
+# being listed; an all-caps rendering (as in headings) is accepted.
+GLOSSARY = {
+    'Interactive Vehicle Accident Response System': [
+        'Incident Verification and Response System',
+        'Intelligent Vehicle Accident Response System',
+    ],
+    'MongoDB': ['Mongo DB'],
+    'SendGrid': ['Send Grid'],
+    'Node.js': ['NodeJS', 'Node JS'],
+    'Express.js': ['ExpressJS', 'Express JS'],
+    'JavaScript': ['Java Script'],
+    'TypeScript': ['Type Script'],
+    'Tailwind CSS': ['TailwindCSS'],
+    'Google Maps API': ['Google Map API', 'GoogleMaps API'],
+}
+
+SKIP_DIRS = {'node_modules', 'dist', 'build', '__pycache__'}
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+CODE_FENCES = ('```', '~~~')
+# Characters that glue a term into an identifier, package name or path
+IDENTIFIER_BEFORE = set('_@/\\.')
+IDENTIFIER_AFTER = set('_/\\')
+
+@dataclass(slots=True)
+class TermHit:
+    location: str
+    start: int
+    end: int
+    found: str
+    canonical: str
+    fixed: bool = False
+
+class Glossary:
+    """Canonical terms and their variants compiled into one automaton.
+
+    Matching is case-insensitive; a hit is reported when its spelling is
+    neither the canonical term nor the canonical term in capitals.
+    """
+
+    def __init__(self, glossary):
+        self.canonical = []
+        patterns = []
+        for canonical, variants in glossary.items():
+            for spelling in (canonical, *variants):
+                patterns.append(spelling.lower())
+                self.canonical.append(canonical)
+        self.automaton = PatternAutomaton(patterns)
+
+    def scan(self, text, location=''):
+        """Leftmost-longest variant hits in text"""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            lowered = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+        hits = []
+        for start, end, index in sorted(self.automaton.finditer(lowered), key=lambda hit: (hit[0], -hit[1])):
+            if hits and start < hits[-1][1]:
+                continue
+            if not on_word_boundary(text, start, end) or _in_identifier(text, start, end):
+                continue
+            hits.append((start, end, index))
+        result = []
+        for start, end, index in hits:
+            found = text[start:end]
+            canonical = self.canonical[index]
+            if found not in (canonical, canonical.upper()):
+                result.append(TermHit(location, start, end, found, canonical))
+        return result
+
+def _in_identifier(text, start, end):
+    if start and text[start - 1] in IDENTIFIER_BEFORE:
+        return True
+    if end < len(text) and (text[end] in IDENTIFIER_AFTER or text.startswith('://', end)):
+        return True
+    return end + 1 < len(text) and text[end] == '.' and text[end + 1].isalnum()
+
+def replacement(hit):
+    return hit.canonical.upper() if hit.found.isupper() else hit.canonical
+
+def load_glossary(path=None):
+    if path is None:
+        return GLOSSARY
+    with open(path, encoding='utf-8') as f:
+        glossary = json.load(f)
+    if not isinstance(glossary, dict) or not all(isinstance(v, list) for v in glossary.values()):
+        raise ValueError(f"{path} must map canonical terms to lists of variants")
+    return glossary
+
+def find_documents(paths):
+    """.docx and .md files under the given paths, skipping dependencies and hidden dirs"""
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        for directory, dirs, names in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+            found.extend(os.path.join(directory, name) for name in sorted(names)
+                         if name.lower().endswith(('.docx', '.md')) and not name.startswith('~$'))
+    return found
+
+def _blank_code_spans(line):
+    """Replace inline code with spaces, keeping column offsets"""
+    parts = line.split('`')
+    if len(parts) % 2 == 0:
+        return line
+    return '`'.join(part if n % 2 == 0 else ' ' * len(part) for n, part in enumerate(parts))
+
+def iter_markdown_lines(text):
+    """Yield (line number, line) outside fenced code blocks, with inline code blanked"""
+    fence = None
+    for number, line in enumerate(text.splitlines(keepends=True), start=1):
+        stripped = line.lstrip()
+        if fence:
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        fence = next((marker for marker in CODE_FENCES if stripped.startswith(marker)), None)
+        if not fence:
+            yield number, _blank_code_spans(line)
+
+def scan_markdown(path, glossary, fix=False):
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+    hits = []
+    lines = text.splitlines(keepends=True)
+    for number, visible in iter_markdown_lines(text):
+        line_hits = glossary.scan(visible)
+        for hit in line_hits:
+            hit.location = f'line {number}, column {hit.start + 1}'
+        if fix and line_hits:
+            line = lines[number - 1]
+            for hit in reversed(line_hits):
+                line = line[:hit.start] + replacement(hit) + line[hit.end:]
+                hit.fixed = True
+            lines[number - 1] = line
+        hits.extend(line_hits)
+    if fix and hits:
+        write_atomic(path, ''.join(lines).encode('utf-8'))
+    return hits
+
+def _text_slices(paragraph):
+    """(w:t element or None, start, end) covering the paragraph's text offsets"""
+    slices = []
+    position = 0
+    for run in iter_runs(paragraph):
+        for item in run:
+            length = len(run_item_text(item))
+            if length:
+                slices.append((item if item.tag == W_T else None, position, position + length))
+                position += length
+    return slices
+
+def fix_paragraph(paragraph, hits):
+    """Rewrite hits in place, even when a term is split across several runs.
+
+    The replacement goes into the w:t holding the hit's first character and
+    the rest of the hit is cut from the following w:t elements, so run
+    formatting around the term is kept. Hits that touch text outside a w:t
+    (a tab, a break, a field result) are left alone. Returns the hits that
+    were fixed, each marked fixed.
+    """
+    slices = _text_slices(paragraph)
+    fixed = []
+    for hit in reversed(hits):
+        covering = [(element, start, end) for element, start, end in slices
+                    if start < hit.end and end > hit.start]
+        if not covering or any(element is None for element, _, _ in covering):
+            continue
+        new_text = replacement(hit)
+        for n, (element, start, end) in enumerate(covering):
+            text = element.text or ''
+            cut_from = max(hit.start, start) - start
+            cut_to = min(hit.end, end) - start
+            element.text = text[:cut_from] + (new_text if n == 0 else '') + text[cut_to:]
+            if element.text != element.text.strip():
+                element.set(XML_SPACE, 'preserve')
+        # Hits run right to left, so the offsets of earlier ones still hold
+        hit.fixed = True
+        fixed.append(hit)
+    fixed.reverse()
+    return fixed
+
+def scan_docx(path, glossary, fix=False):
+    """Scan every paragraph of the main document, tables and text boxes included"""
+    hits = []
+    with DocxPackage(path) as archive:
+        document_name = main_document_name(archive)
+        styles = read_styles(archive, document_name)
+        with archive.open(document_name) as source:
+            if fix:
+                tree = etree.parse(source)
+                paragraphs = ((None, p) for p in tree.iter(W_P))
+            else:
+                tree = None
+                paragraphs = etree.iterparse(source, events=('end',), tag=W_P)
+            heading = ''
+            changed = False
+            for number, (_, paragraph) in enumerate(paragraphs, start=1):
+                text = paragraph_text(paragraph)
+                parent = paragraph.getparent()
+                if parent is not None and parent.tag == W_BODY and styles.level(paragraph_style_id(paragraph)):
+                    heading = ' '.join(text.split()) or heading
+                location = f"paragraph {number}" + (f" ({heading[:40]})" if heading else '')
+                paragraph_hits = glossary.scan(text, location)
+                if fix and paragraph_hits:
+                    changed = bool(fix_paragraph(paragraph, paragraph_hits)) or changed
+                hits.extend(paragraph_hits)
+                if tree is None:
+                    paragraph.clear(keep_tail=True)
+    if fix and changed:
+        data = etree.tostring(tree, xml_declaration=True, encoding='UTF-8', standalone=True)
+        repackage_docx(path, path, {document_name: data})
+    return hits
+
+_glossary = None
+_fix = False
+
+def _init_worker(glossary, fix):
+    global _glossary, _fix
+    _glossary = Glossary(glossary)
+    _fix = fix
+
+def _scan_job(path):
+    start = time.perf_counter()
+    scan = scan_docx if path.lower().endswith('.docx') else scan_markdown
+    try:
+        hits = scan(path, _glossary, _fix)
+    except Exception as exc:
+        return path, None, f"{type(exc).__name__}: {exc}", time.perf_counter() - start
+    return path, hits, None, time.perf_counter() - start
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='check_terms',
+                                     description='Report (and optionally fix) inconsistent terminology '
+                                                 'in .docx reports and Markdown docs.')
+    parser.add_argument('paths', nargs='*', default=['.'], help='files or directories to scan (default: .)')
+    parser.add_argument('--glossary', help='JSON file mapping canonical terms to variant lists '
+                                           '(default: the built-in glossary)')
+    parser.add_argument('--fix', action='store_true', help='rewrite variants to the canonical term in place')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+
+    glossary = load_glossary(args.glossary)
+    paths = find_documents(args.paths)
+    start = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(paths))),
+                             initializer=_init_worker, initargs=(glossary, args.fix)) as pool:
+        futures = [pool.submit(_scan_job, path) for path in paths]
+        for future in as_completed(futures):
+            results.append(future.result())
+    results.sort()
+
+    totals = {}
+    unfixed = 0
+    failures = 0
+    for path, hits, error, _ in results:
+        if error:
+            failures += 1
+            print(f"{path}: {error}", file=sys.stderr)
+            continue
+        for hit in hits:
+            if hit.fixed:
+                action = 'fixed'
+            elif args.fix:
+                action = 'not fixed, use'
+                unfixed += 1
+            else:
+                action = 'use'
+            print(f"{path}: {hit.location}: '{hit.found}' ({action} '{replacement(hit)}')")
+            totals[hit.canonical] = totals.get(hit.canonical, 0) + 1
+
+    print("-" * 80)
+    for canonical, count in sorted(totals.items(), key=lambda item: -item[1]):
+        print(f"  {canonical:<50} {count:>5} variant(s)")
+    left = f" ({unfixed} not fixed)" if args.fix else ''
+    print(f"{len(paths)} file(s), {sum(totals.values())} variant(s){left}, {failures} failed "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 1 if totals or failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
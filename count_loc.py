@@ -0,0 +1,268 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from docx_package import write_atomic
+
+LOC_CACHE_VERSION = 2
+LOC_CACHE_PATH = '.loc-cache.json'
+
+SKIP_DIRS = {'node_modules', 'dist', 'build', 'coverage', 'public', '__pycache__'}
+LOCKFILES = {'package-lock.json', 'npm-shrinkwrap.json', 'yarn.lock', 'pnpm-lock.yaml'}
+# Declaration files and bundles written by tooling, not by hand
+GENERATED_SUFFIXES = ('.d.ts', '.min.js', '.min.css', '.map')
+
+@dataclass(frozen=True, slots=True)
+class Bucket:
+    module: str
+    technology: str
+    roots: tuple
+    suffixes: tuple
+
+    def matches(self, relative_path):
+        if not relative_path.endswith(self.suffixes):
+            return False
+        return any(not root or relative_path.startswith(root + '/') for root in self.roots)
+
+# The module rows of the report's size table, in order; a root of ''
+# matches anywhere in the tree
+BUCKETS = (
+    Bucket('Backend', 'Node.js / Express', ('server',), ('.js', '.mjs', '.cjs', '.ts')),
+    Bucket('Frontend', 'React / TypeScript', ('src',), ('.ts', '.tsx', '.js', '.jsx')),
+    Bucket('UI & Utilities', 'CSS / HTML', ('',), ('.css', '.scss', '.html')),
+)
+
+# suffix -> (line comment, block comment start, block comment end, string quotes)
+COMMENT_SYNTAX = {
+    '.js': ('//', '/*', '*/', '\'"`'),
+    '.css': (None, '/*', '*/', '\'"'),
+    '.html': (None, '<!--', '-->', ''),
+}
+for _suffix in ('.mjs', '.cjs', '.jsx', '.ts', '.tsx'):
+    COMMENT_SYNTAX[_suffix] = COMMENT_SYNTAX['.js']
+COMMENT_SYNTAX['.scss'] = ('//', '/*', '*/', '\'"')
+
+@dataclass(slots=True)
+class LineCounts:
+    code: int = 0
+    comment: int = 0
+    blank: int = 0
+    files: int = 0
+
+    def add(self, other):
+        self.code += other.code
+        self.comment += other.comment
+        self.blank += other.blank
+        self.files += other.files
+
+@dataclass(slots=True)
+class SizeReport:
+    modules: list = field(default_factory=list)  # (Bucket, LineCounts) in BUCKETS order
+    counted: int = 0
+    reused: int = 0
+
+    @property
+    def total(self):
+        """Source lines of code: lines holding code, comments and blanks excluded"""
+        return sum(counts.code for _, counts in self.modules)
+
+    @property
+    def kloc(self):
+        return self.total / 1000
+
+def _token_pattern(syntax):
+    line_comment, block_start, _, quotes = syntax
+    markers = [re.escape(marker) for marker in (line_comment, block_start) if marker]
+    if quotes:
+        markers.append(f'[{re.escape(quotes)}]')
+    return re.compile('|'.join(markers))
+
+_TOKENS = {syntax: _token_pattern(syntax) for syntax in set(COMMENT_SYNTAX.values())}
+
+def _quote_end(line, start, quote):
+    """Index just past the closing quote, or -1 if the string runs on"""
+    position = start
+    while True:
+        position = line.find(quote, position)
+        if position < 0:
+            return -1
+        escapes = position - len(line[:position].rstrip('\\'))
+        if escapes % 2 == 0:
+            return position + 1
+        position += 1
+
+def count_lines(text, syntax):
+    """Classify each line as code, comment or blank.
+
+    A line with any code on it counts as code, even if it also carries a
+    comment. Block comments and template strings may span lines; quote
+    characters inside comments and comment markers inside strings are
+    ignored.
+    """
+    line_comment, block_start, block_end, quotes = syntax
+    tokens = _TOKENS[syntax]
+    counts = LineCounts(files=1)
+    closing = None  # block_end or the quote we are inside at the start of a line
+    for line in text.splitlines():
+        if not line.strip():
+            counts.blank += 1
+            continue
+        has_code = has_comment = False
+        position = 0
+        while position < len(line):
+            if closing == block_end:
+                has_comment = True
+                end = line.find(block_end, position)
+                if end < 0:
+                    break
+                position, closing = end + len(block_end), None
+                continue
+            if closing is not None:
+                has_code = True
+                end = _quote_end(line, position, closing)
+                if end < 0:
+                    break
+                position, closing = end, None
+                continue
+            match = tokens.search(line, position)
+            if match is None:
+                has_code = has_code or bool(line[position:].strip())
+                break
+            has_code = has_code or bool(line[position:match.start()].strip())
+            marker = match.group()
+            position = match.end()
+            if marker == line_comment:
+                has_comment = True
+                break
+            if marker == block_start:
+                has_comment = True
+                closing = block_end
+            else:
+                closing = marker
+        # Only template literals continue past the end of a line
+        if closing is not None and closing != block_end and closing != '`' and not line.endswith('\\'):
+            closing = None
+        if has_code:
+            counts.code += 1
+        elif has_comment:
+            counts.comment += 1
+        else:
+            counts.blank += 1
+    return counts
+
+def find_sources(root='.'):
+    """(path relative to root, Bucket) for each hand-written source file"""
+    sources = []
+    for directory, dirs, names in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith('.'))
+        for name in sorted(names):
+            if name in LOCKFILES or name.endswith(GENERATED_SUFFIXES):
+                continue
+            relative = os.path.relpath(os.path.join(directory, name), root).replace(os.sep, '/')
+            bucket = next((bucket for bucket in BUCKETS if bucket.matches(relative)), None)
+            if bucket is not None:
+                sources.append((relative, bucket))
+    return sources
+
+def count_file(path):
+    with open(path, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    return count_lines(text, COMMENT_SYNTAX[os.path.splitext(path)[1].lower()])
+
+def load_loc_cache(cache_path):
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {'version': LOC_CACHE_VERSION, 'files': {}}
+    if cache.get('version') != LOC_CACHE_VERSION:
+        return {'version': LOC_CACHE_VERSION, 'files': {}}
+    return cache
+
+def save_loc_cache(cache_path, cache):
+    write_atomic(cache_path, json.dumps(cache, separators=(',', ':')).encode('utf-8'))
+
+def measure_sources(root='.', jobs=None, use_cache=True):
+    """Count every source file under root by module bucket.
+
+    Files whose size and mtime match the cache (.loc-cache.json in root)
+    are not re-read, so re-counting after a small edit only touches the
+    edited files. Entries for deleted files are dropped from the cache.
+    """
+    cache_path = os.path.join(root, LOC_CACHE_PATH)
+    cache = load_loc_cache(cache_path) if use_cache else {'version': LOC_CACHE_VERSION, 'files': {}}
+    files = cache['files']
+    sources = find_sources(root)
+    report = SizeReport(modules=[(bucket, LineCounts()) for bucket in BUCKETS])
+    totals = {bucket: counts for bucket, counts in report.modules}
+
+    stale = []
+    for relative, bucket in sources:
+        stat = os.stat(os.path.join(root, relative))
+        entry = files.get(relative)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            totals[bucket].add(LineCounts(entry['code'], entry['comment'], entry['blank'], 1))
+            report.reused += 1
+        else:
+            stale.append((relative, bucket, stat))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            counted = pool.map(count_file, [os.path.join(root, relative) for relative, _, _ in stale])
+            for (relative, bucket, stat), counts in zip(stale, counted):
+                totals[bucket].add(counts)
+                files[relative] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns,
+                                   'code': counts.code, 'comment': counts.comment, 'blank': counts.blank}
+        report.counted = len(stale)
+
+    if use_cache:
+        current = {relative for relative, _ in sources}
+        removed = [relative for relative in files if relative not in current]
+        for relative in removed:
+            del files[relative]
+        if stale or removed:
+            save_loc_cache(cache_path, cache)
+    return report
+
+def print_report(report, out=sys.stdout):
+    print(f"{'Module':<16} {'Technology':<20} {'files':>6} {'code':>7} {'comment':>8} {'blank':>7}", file=out)
+    print("-" * 69, file=out)
+    total = LineCounts()
+    for bucket, counts in report.modules:
+        total.add(counts)
+        print(f"{bucket.module:<16} {bucket.technology:<20} {counts.files:>6} {counts.code:>7} "
+              f"{counts.comment:>8} {counts.blank:>7}", file=out)
+    print("-" * 69, file=out)
+    print(f"{'Total':<37} {total.files:>6} {total.code:>7} {total.comment:>8} {total.blank:>7}", file=out)
+    print(f"Project size: {report.kloc:.1f} KLOC", file=out)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='count_loc',
+                                     description='Count code, comment and blank lines per report module.')
+    parser.add_argument('root', nargs='?', default='.', help='repository root (default: .)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='counting threads (default: Python\'s thread pool default)')
+    parser.add_argument('--no-cache', action='store_true', help=f'ignore and do not write {LOC_CACHE_PATH}')
+    parser.add_argument('--json', action='store_true', help='print the counts as JSON')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    report = measure_sources(args.root, args.jobs, use_cache=not args.no_cache)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        json.dump({bucket.module: {'technology': bucket.technology, 'files': counts.files, 'code': counts.code,
+                                   'comment': counts.comment, 'blank': counts.blank}
+                   for bucket, counts in report.modules}, sys.stdout, indent=2)
+        print()
+    else:
+        print_report(report)
+        print(f"{report.counted} file(s) counted, {report.reused} from cache in {elapsed:.3f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+import argparse
+import difflib
+import json
+import sys
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from dataclasses import dataclass
+
+from read_docx import iter_heading_paragraphs
+
+PREVIEW_LENGTH = 80
+PREAMBLE = '(before first heading)'
+# difflib's matcher is quadratic; gaps without unique anchors larger than
+# this many (old x new) paragraph pairs are reported as deleted + inserted
+FALLBACK_LIMIT = 250_000
+
+@dataclass(slots=True)
+class Paragraph:
+    index: int
+    style: str
+    text: str
+    heading: tuple
+    key: int = 0
+    text_key: int = 0
+
+def read_paragraphs(path):
+    """Non-empty body paragraphs with their style and enclosing heading path"""
+    return [Paragraph(index, style, text, heading)
+            for index, style, text, heading in iter_heading_paragraphs(path)]
+
+def assign_keys(*documents):
+    """Replace each paragraph's (style, text) and text with small shared integer ids"""
+    keys = {}
+    text_keys = {}
+    for paragraphs in documents:
+        for paragraph in paragraphs:
+            paragraph.key = keys.setdefault((paragraph.style, paragraph.text), len(keys))
+            paragraph.text_key = text_keys.setdefault(paragraph.text, len(text_keys))
+
+def _unique_positions(sequence, lo, hi):
+    counts = {}
+    positions = {}
+    for position in range(lo, hi):
+        item = sequence[position]
+        counts[item] = counts.get(item, 0) + 1
+        positions[item] = position
+    return {item: positions[item] for item, count in counts.items() if count == 1}
+
+def _longest_increasing(pairs):
+    """Longest run of pairs increasing in both positions (patience sorting)"""
+    tails = []
+    tail_positions = []
+    previous = [None] * len(pairs)
+    for n, (_, b_position) in enumerate(pairs):
+        pile = bisect_left(tails, b_position)
+        if pile > 0:
+            previous[n] = tail_positions[pile - 1]
+        if pile == len(tails):
+            tails.append(b_position)
+            tail_positions.append(n)
+        else:
+            tails[pile] = b_position
+            tail_positions[pile] = n
+    result = []
+    n = tail_positions[-1] if tail_positions else None
+    while n is not None:
+        result.append(pairs[n])
+        n = previous[n]
+    result.reverse()
+    return result
+
+def patience_matches(a, b, skipped=None):
+    """Matched (i, j) positions between two key sequences, in order.
+
+    Common prefixes and suffixes are matched first, then keys unique to
+    both sides anchor the alignment and the gaps between anchors are
+    diffed recursively. Gaps without unique keys fall back to difflib,
+    up to FALLBACK_LIMIT pairs; larger ones are left unmatched and, when
+    skipped is a list, appended to it as (alo, ahi, blo, bhi).
+    """
+    matches = []
+    pending = deque([(0, len(a), 0, len(b))])
+    while pending:
+        alo, ahi, blo, bhi = pending.popleft()
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            matches.append((alo, blo))
+            alo += 1
+            blo += 1
+        tail = []
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            tail.append((ahi, bhi))
+        matches.extend(tail)
+        if alo == ahi or blo == bhi:
+            continue
+        unique_a = _unique_positions(a, alo, ahi)
+        unique_b = _unique_positions(b, blo, bhi)
+        anchors = _longest_increasing(sorted(
+            (position, unique_b[item]) for item, position in unique_a.items() if item in unique_b))
+        if not anchors:
+            if (ahi - alo) * (bhi - blo) > FALLBACK_LIMIT:
+                if skipped is not None:
+                    skipped.append((alo, ahi, blo, bhi))
+                continue
+            matcher = difflib.SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=False)
+            for i, j, size in matcher.get_matching_blocks():
+                matches.extend((alo + i + k, blo + j + k) for k in range(size))
+            continue
+        previous_a, previous_b = alo, blo
+        for i, j in anchors:
+            matches.append((i, j))
+            pending.append((previous_a, i, previous_b, j))
+            previous_a, previous_b = i + 1, j + 1
+        pending.append((previous_a, ahi, previous_b, bhi))
+    matches.sort()
+    return matches
+
+@dataclass(slots=True)
+class Change:
+    kind: str
+    old: Paragraph | None
+    new: Paragraph | None
+
+    @property
+    def heading(self):
+        return (self.new or self.old).heading
+
+    def as_dict(self):
+        paragraph = self.new or self.old
+        return {
+            'kind': self.kind,
+            'heading': list(self.heading),
+            'old_index': self.old.index if self.old else None,
+            'new_index': self.new.index if self.new else None,
+            'old_style': self.old.style if self.old else None,
+            'new_style': self.new.style if self.new else None,
+            'text': paragraph.text,
+        }
+
+def diff_paragraphs(old, new):
+    """Classify unmatched paragraphs as moved, restyled, deleted or inserted.
+
+    A deleted paragraph whose text and style reappear elsewhere is a move;
+    one whose text reappears with another style is a restyle. Paragraphs
+    of gaps too large to align are only ever deleted or inserted, since
+    pairing them by key would report a rewritten stretch as moves.
+    """
+    assign_keys(old, new)
+    skipped = []
+    matches = patience_matches([p.key for p in old], [p.key for p in new], skipped)
+    old_positions = {id(p): i for i, p in enumerate(old)}
+    new_positions = {id(p): j for j, p in enumerate(new)}
+    matched_old = {i for i, _ in matches}
+    matched_new = {j for _, j in matches}
+    unaligned_old = {i for alo, ahi, _, _ in skipped for i in range(alo, ahi)}
+    unaligned_new = {j for _, _, blo, bhi in skipped for j in range(blo, bhi)}
+    deleted = [p for i, p in enumerate(old) if i not in matched_old and i not in unaligned_old]
+    inserted = [p for j, p in enumerate(new) if j not in matched_new and j not in unaligned_new]
+
+    changes = []
+    for kind, attribute in (('moved', 'key'), ('restyled', 'text_key')):
+        candidates = defaultdict(deque)
+        for paragraph in inserted:
+            candidates[getattr(paragraph, attribute)].append(paragraph)
+        paired = set()
+        remaining = []
+        for paragraph in deleted:
+            queue = candidates.get(getattr(paragraph, attribute))
+            if queue:
+                partner = queue.popleft()
+                paired.add(id(partner))
+                changes.append(Change(kind, paragraph, partner))
+            else:
+                remaining.append(paragraph)
+        deleted = remaining
+        inserted = [p for p in inserted if id(p) not in paired]
+
+    deleted.extend(old[i] for i in sorted(unaligned_old))
+    inserted.extend(new[j] for j in sorted(unaligned_new))
+    changes.extend(Change('deleted', p, None) for p in deleted)
+    changes.extend(Change('inserted', None, p) for p in inserted)
+    matched_old_positions = [i for i, _ in matches]
+    matched_new_positions = [j for _, j in matches]
+
+    def alignment_key(change):
+        """(old position, new position) of a change along the alignment.
+
+        A deleted paragraph takes the new-side position just after the
+        match preceding it, an inserted one the old-side position likewise.
+        """
+        if change.old is not None and change.new is not None:
+            return old_positions[id(change.old)], new_positions[id(change.new)]
+        if change.old is not None:
+            i = old_positions[id(change.old)]
+            k = bisect_left(matched_old_positions, i)
+            return i, (matched_new_positions[k - 1] if k else -1) + 0.5
+        j = new_positions[id(change.new)]
+        k = bisect_left(matched_new_positions, j)
+        return (matched_old_positions[k - 1] if k else -1) + 0.5, j
+
+    changes.sort(key=alignment_key)
+    return changes, len(matches)
+
+def group_by_heading(changes):
+    groups = {}
+    for change in changes:
+        groups.setdefault(change.heading, []).append(change)
+    return groups
+
+def preview(text):
+    return text if len(text) <= PREVIEW_LENGTH else text[:PREVIEW_LENGTH - 3] + '...'
+
+def describe(change):
+    if change.kind == 'inserted':
+        return f"+ [{change.new.index}] ({change.new.style}) {preview(change.new.text)}"
+    if change.kind == 'deleted':
+        return f"- [{change.old.index}] ({change.old.style}) {preview(change.old.text)}"
+    if change.kind == 'moved':
+        return f"> [{change.old.index} -> {change.new.index}] {preview(change.new.text)}"
+    return (f"~ [{change.old.index} -> {change.new.index}] "
+            f"{change.old.style} -> {change.new.style}: {preview(change.new.text)}")
+
+def print_report(changes, unchanged, out=sys.stdout):
+    for heading, group in group_by_heading(changes).items():
+        print(' > '.join(heading) or PREAMBLE, file=out)
+        for change in group:
+            print(f"    {describe(change)}", file=out)
+    counts = {kind: 0 for kind in ('inserted', 'deleted', 'moved', 'restyled')}
+    for change in changes:
+        counts[change.kind] += 1
+    summary = ', '.join(f"{count} {kind}" for kind, count in counts.items())
+    print(f"{unchanged} unchanged, {summary}", file=out)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='diff_docx',
+                                     description='Compare the paragraphs of two .docx report versions.')
+    parser.add_argument('old', help='earlier version of the report')
+    parser.add_argument('new', help='later version of the report')
+    parser.add_argument('--json', action='store_true', help='print the changes as JSON')
+    parser.add_argument('--timing', action='store_true', help='report read and diff times on stderr')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    old = read_paragraphs(args.old)
+    new = read_paragraphs(args.new)
+    read_elapsed = time.perf_counter() - start
+    changes, unchanged = diff_paragraphs(old, new)
+    diff_elapsed = time.perf_counter() - start - read_elapsed
+
+    if args.json:
+        json.dump({'unchanged': unchanged, 'changes': [change.as_dict() for change in changes]},
+                  sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_report(changes, unchanged)
+    if args.timing:
+        print(f"read {len(old)} + {len(new)} paragraphs in {read_elapsed * 1000:.1f} ms, "
+              f"diffed in {diff_elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 1 if changes else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,364 @@
+import io
+import mmap
+import os
+import posixpath
+import shutil
+import struct
+import tempfile
+import zipfile
+import zlib
+from dataclasses import dataclass
+
+from lxml import etree
+
+PACKAGE_RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+REL_TYPE_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+REL_TYPE_STYLES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+REL_TYPE_NUMBERING = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering'
+REL_TYPE_IMAGE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+
+RELATIONSHIP = f'{{{PACKAGE_RELS_NS}}}Relationship'
+
+STREAM_CHUNK_SIZE = 64 * 1024
+# End-of-central-directory record plus the longest possible archive comment
+EOCD_SEARCH_SIZE = zipfile.sizeEndCentDir + 0xFFFF
+
+@dataclass(slots=True)
+class PackageMember:
+    name: str
+    method: int
+    crc: int
+    compressed_size: int
+    size: int
+    header_offset: int
+
+class _MemberStream(io.RawIOBase):
+    """Read-only stream that inflates one member straight from the mapping"""
+
+    def __init__(self, package, member, data):
+        self._package = package
+        self._member = member
+        self._data = data
+        self._offset = 0
+        self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS) if member.method else None
+        self._pending = memoryview(b'')
+        self._crc = 0
+        self._produced = 0
+        self._eof = False
+
+    def readable(self):
+        return True
+
+    def close(self):
+        if not self.closed:
+            self._data.release()
+        super().close()
+
+    def _fill(self):
+        if self._decompressor is None:
+            chunk = self._data[self._offset:self._offset + STREAM_CHUNK_SIZE]
+            self._offset += len(chunk)
+            self._package.bytes_touched += len(chunk)
+            chunk = bytes(chunk)
+        else:
+            source = self._decompressor.unconsumed_tail
+            view = None
+            if not source and self._offset < len(self._data):
+                view = source = self._data[self._offset:self._offset + STREAM_CHUNK_SIZE]
+                self._offset += len(source)
+                self._package.bytes_touched += len(source)
+            exhausted = not source
+            try:
+                chunk = self._decompressor.decompress(source, STREAM_CHUNK_SIZE) if source else b''
+            except zlib.error as exc:
+                raise zipfile.BadZipFile(f"Bad compressed data for {self._member.name}") from exc
+            finally:
+                # A slice left alive in a traceback would keep the mapping from closing
+                if view is not None:
+                    view.release()
+            if not chunk and exhausted:
+                chunk = self._decompressor.flush()
+        if chunk:
+            self._crc = zlib.crc32(chunk, self._crc)
+            self._produced += len(chunk)
+            self._pending = memoryview(chunk)
+        elif self._offset >= len(self._data) and not (self._decompressor and self._decompressor.unconsumed_tail):
+            self._eof = True
+            if self._crc != self._member.crc or self._produced != self._member.size:
+                raise zipfile.BadZipFile(f"Bad CRC or size for {self._member.name}")
+
+    def readinto(self, buffer):
+        while not self._pending and not self._eof:
+            self._fill()
+        count = min(len(buffer), len(self._pending))
+        buffer[:count] = self._pending[:count]
+        self._pending = self._pending[count:]
+        return count
+
+class DocxPackage:
+    """Read-only, memory-mapped view of a .docx package.
+
+    Only the central directory is parsed up front; members are inflated on
+    demand straight from the mapping, so opening a report for its text
+    never touches the images. Offers the read/open/namelist subset of
+    zipfile.ZipFile that the readers here use.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.bytes_touched = 0
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:
+                raise zipfile.BadZipFile(f"{path} is not a zip file") from exc
+        try:
+            self.members = self._read_central_directory()
+        except BaseException:
+            self._map.close()
+            raise
+
+    def _read_central_directory(self):
+        data = self._map
+        search_start = max(0, len(data) - EOCD_SEARCH_SIZE)
+        position = data.rfind(zipfile.stringEndArchive, search_start)
+        if position < 0:
+            raise zipfile.BadZipFile(f"{self.path} is not a zip file")
+        record = struct.unpack(zipfile.structEndArchive, data[position:position + zipfile.sizeEndCentDir])
+        count, directory_size, directory_offset = record[4], record[5], record[6]
+        if count == 0xFFFF or directory_offset == 0xFFFFFFFF:
+            raise zipfile.BadZipFile(f"{self.path} needs ZIP64, which is not supported")
+        if directory_offset + directory_size > position:
+            raise zipfile.BadZipFile(f"{self.path} is truncated")
+        self.bytes_touched += len(data) - position + directory_size
+
+        members = {}
+        offset = directory_offset
+        for _ in range(count):
+            header = struct.unpack(zipfile.structCentralDir, data[offset:offset + zipfile.sizeCentralDir])
+            if header[0] != zipfile.stringCentralDir:
+                raise zipfile.BadZipFile(f"Bad central directory in {self.path}")
+            flags, method = header[5], header[6]
+            name_length, extra_length, comment_length = header[12], header[13], header[14]
+            start = offset + zipfile.sizeCentralDir
+            raw_name = data[start:start + name_length]
+            name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437')
+            if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+                raise NotImplementedError(f"{name} uses unsupported compression method {method}")
+            members[name] = PackageMember(name, method, header[9], header[10], header[11], header[18])
+            offset = start + name_length + extra_length + comment_length
+        return members
+
+    def namelist(self):
+        return list(self.members)
+
+    def open(self, name):
+        """Stream a member's uncompressed bytes; raises KeyError like zipfile"""
+        member = self.members[name]
+        header_offset = member.header_offset
+        header = struct.unpack(zipfile.structFileHeader,
+                               self._map[header_offset:header_offset + zipfile.sizeFileHeader])
+        if header[0] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile(f"Bad local header for {name}")
+        start = header_offset + zipfile.sizeFileHeader + header[10] + header[11]
+        self.bytes_touched += start - header_offset
+        data = memoryview(self._map)[start:start + member.compressed_size]
+        return io.BufferedReader(_MemberStream(self, member, data), STREAM_CHUNK_SIZE)
+
+    def read(self, name):
+        with self.open(name) as stream:
+            return stream.read()
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+COPY_CHUNK_SIZE = 1 << 20
+DEFLATE_LEVEL = 6
+
+def _dos_timestamp(date_time):
+    """Pack a ZipInfo date_time tuple into DOS (time, date) fields"""
+    year, month, day, hour, minute, second = date_time
+    return (hour << 11 | minute << 5 | second // 2,
+            max(year - 1980, 0) << 9 | month << 5 | day)
+
+def _encode_member_name(name):
+    """Return the encoded member name and the UTF-8 flag it needs"""
+    try:
+        return name.encode('ascii'), 0
+    except UnicodeEncodeError:
+        return name.encode('utf-8'), 0x800
+
+def _member_data_offset(source, info):
+    """Find where a member's compressed bytes start in the source archive"""
+    source.seek(info.header_offset)
+    header = struct.unpack(zipfile.structFileHeader, source.read(zipfile.sizeFileHeader))
+    name_length, extra_length = header[-2], header[-1]
+    return info.header_offset + zipfile.sizeFileHeader + name_length + extra_length
+
+class _DeflateWriter:
+    """Binary sink that deflates into a zip member while tracking CRC and sizes"""
+
+    def __init__(self, target):
+        self._target = target
+        self._compressor = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -15)
+        self.crc = 0
+        self.size = 0
+        self.compressed_size = 0
+
+    def write(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        self._emit(self._compressor.compress(data))
+        return len(data)
+
+    def finish(self):
+        self._emit(self._compressor.flush())
+
+    def _emit(self, data):
+        self._target.write(data)
+        self.compressed_size += len(data)
+
+def repackage_docx(source_path, output_path, replacements):
+    """Copy a .docx package, replacing only the given members.
+
+    replacements maps member names to their new uncompressed bytes, to a
+    callable that streams them into the binary file object it is given, or
+    to None to leave the member out of the output. Every other member is
+    copied as raw compressed bytes, so images and other untouched parts
+    are never inflated or deflated again. The archive is written to a
+    temporary file first, so output_path may equal source_path.
+    """
+    output_dir = os.path.dirname(os.path.abspath(output_path))
+    fd, temp_path = tempfile.mkstemp(suffix='.docx', dir=output_dir)
+    central_directory = []
+    try:
+        with zipfile.ZipFile(source_path) as archive, \
+                open(source_path, 'rb') as source, os.fdopen(fd, 'wb') as target:
+            for info in archive.infolist():
+                if info.filename in replacements and replacements[info.filename] is None:
+                    continue
+                name, name_flag = _encode_member_name(info.filename)
+                flags = (info.flag_bits & ~0x08) | name_flag
+                dos_time, dos_date = _dos_timestamp(info.date_time)
+                offset = target.tell()
+                replaced = info.filename in replacements
+                if replaced:
+                    flags &= ~0x06
+                    method, crc, compressed_size, size = zipfile.ZIP_DEFLATED, 0, 0, 0
+                else:
+                    method, crc = info.compress_type, info.CRC
+                    compressed_size, size = info.compress_size, info.file_size
+
+                target.write(struct.pack(
+                    zipfile.structFileHeader, zipfile.stringFileHeader, 20, 0, flags, method,
+                    dos_time, dos_date, crc, compressed_size, size, len(name), 0,
+                ))
+                target.write(name)
+                if replaced:
+                    writer = _DeflateWriter(target)
+                    content = replacements[info.filename]
+                    if callable(content):
+                        content(writer)
+                    else:
+                        writer.write(content)
+                    writer.finish()
+                    crc, compressed_size, size = writer.crc, writer.compressed_size, writer.size
+                    # Patch the CRC and sizes into the local header written above
+                    end = target.tell()
+                    target.seek(offset + 14)
+                    target.write(struct.pack('<3L', crc, compressed_size, size))
+                    target.seek(end)
+                else:
+                    source.seek(_member_data_offset(source, info))
+                    remaining = info.compress_size
+                    while remaining:
+                        chunk = source.read(min(COPY_CHUNK_SIZE, remaining))
+                        if not chunk:
+                            raise ValueError(f"{source_path} is truncated in {info.filename}")
+                        target.write(chunk)
+                        remaining -= len(chunk)
+                if target.tell() >= zipfile.ZIP64_LIMIT:
+                    raise ValueError(f"{output_path} needs ZIP64, which repackaging does not support")
+
+                central_directory.append(struct.pack(
+                    zipfile.structCentralDir, zipfile.stringCentralDir,
+                    info.create_version, info.create_system, 20, 0, flags, method,
+                    dos_time, dos_date, crc, compressed_size, size, len(name), 0, 0, 0,
+                    info.internal_attr, info.external_attr, offset,
+                ) + name)
+
+            directory_offset = target.tell()
+            for entry in central_directory:
+                target.write(entry)
+            target.write(struct.pack(
+                zipfile.structEndArchive, zipfile.stringEndArchive, 0, 0,
+                len(central_directory), len(central_directory),
+                target.tell() - directory_offset, directory_offset, 0,
+            ))
+        shutil.copymode(source_path, temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def write_atomic(path, data):
+    """Write bytes to path through a temporary file, so readers never see a partial file"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def rels_source_part(rels_name):
+    """Part a relationships member belongs to ('' for the package rels)"""
+    directory, base = posixpath.split(rels_name)
+    return posixpath.join(posixpath.dirname(directory), base[:-len('.rels')])
+
+def resolve_target(source_part, target):
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+def relative_target(source_part, member):
+    return posixpath.relpath(member, posixpath.dirname(source_part) or '.')
+
+def read_relationships(archive):
+    """Parsed relationship trees keyed by their .rels member name"""
+    return {name: etree.fromstring(archive.read(name)) for name in archive.namelist()
+            if name.endswith('.rels') and posixpath.basename(posixpath.dirname(name)) == '_rels'}
+
+def part_relationships(archive, source_name):
+    """Map relationship IDs of a part to (type, member name).
+
+    External targets are left out. Use source_name '' for package-level
+    relationships.
+    """
+    directory, base = posixpath.split(source_name)
+    rels_name = posixpath.join(directory, '_rels', base + '.rels')
+    try:
+        rels = etree.fromstring(archive.read(rels_name))
+    except KeyError:
+        return {}
+    return {rel.get('Id'): (rel.get('Type'), resolve_target(source_name, rel.get('Target')))
+            for rel in rels.iter(RELATIONSHIP) if rel.get('TargetMode') != 'External'}
+
+def related_member(archive, source_name, rel_type):
+    """Resolve the member a part points to with a relationship of rel_type"""
+    for member_type, member in part_relationships(archive, source_name).values():
+        if member_type == rel_type:
+            return member
+    return None
+
+def main_document_name(archive):
+    """Return the member name of the main document part"""
+    return related_member(archive, '', REL_TYPE_OFFICE_DOCUMENT) or 'word/document.xml'
@@ -0,0 +1,376 @@
+import argparse
+import glob
+import os
+import posixpath
+import re
+import shutil
+import sys
+import time
+from dataclasses import dataclass
+from html import escape as html_escape
+
+from lxml import etree
+
+from docx_package import (
+    REL_TYPE_IMAGE,
+    REL_TYPE_NUMBERING,
+    DocxPackage,
+    main_document_name,
+    part_relationships,
+    related_member,
+)
+from read_docx import (
+    A_BLIP,
+    R_EMBED,
+    W_NS,
+    W_P,
+    W_TBL,
+    W_VAL,
+    iter_body_blocks,
+    iter_runs,
+    paragraph_style_id,
+    paragraph_text,
+    read_styles,
+    run_text,
+    table_rows,
+)
+
+WP_DOCPR = '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}docPr'
+W_BOLD_PATH = f'{{{W_NS}}}rPr/{{{W_NS}}}b'
+W_ITALIC_PATH = f'{{{W_NS}}}rPr/{{{W_NS}}}i'
+W_NUMPR_PATH = f'{{{W_NS}}}pPr/{{{W_NS}}}numPr'
+W_NUM_ID = f'{{{W_NS}}}numId'
+W_ILVL = f'{{{W_NS}}}ilvl'
+
+FALSE_VALUES = {'0', 'false', 'off'}
+UNORDERED_FORMATS = {'bullet', 'none'}
+IMAGE_DIR = 'images'
+FRONT_MATTER = 'Front matter'
+MARKDOWN_SPECIAL = re.compile(r'([\\`*_\[\]<>#|])')
+CHAPTER_FILE = re.compile(r'\d{2}-[\w-]*\.(md|html)$')
+
+@dataclass(slots=True)
+class Segment:
+    text: str
+    bold: bool = False
+    italic: bool = False
+    image: str | None = None
+
+def _toggle(run, path):
+    element = run.find(path)
+    return element is not None and element.get(W_VAL, 'true') not in FALSE_VALUES
+
+def read_list_formats(archive, document_name):
+    """Map numId to {level: ordered?} from the numbering part"""
+    numbering_name = related_member(archive, document_name, REL_TYPE_NUMBERING)
+    if numbering_name is None:
+        return {}
+    root = etree.fromstring(archive.read(numbering_name))
+    abstract = {}
+    for definition in root.iterchildren(f'{{{W_NS}}}abstractNum'):
+        levels = {}
+        for level in definition.iterchildren(f'{{{W_NS}}}lvl'):
+            number_format = level.find(f'{{{W_NS}}}numFmt')
+            value = 'decimal' if number_format is None else number_format.get(W_VAL)
+            levels[int(level.get(f'{{{W_NS}}}ilvl', 0))] = value not in UNORDERED_FORMATS
+        abstract[definition.get(f'{{{W_NS}}}abstractNumId')] = levels
+    formats = {}
+    for number in root.iterchildren(f'{{{W_NS}}}num'):
+        reference = number.find(f'{{{W_NS}}}abstractNumId')
+        if reference is not None:
+            formats[number.get(W_NUM_ID)] = abstract.get(reference.get(W_VAL), {})
+    return formats
+
+def slugify(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')[:60] or 'section'
+
+def markdown_escape(text):
+    return MARKDOWN_SPECIAL.sub(r'\\\1', text)
+
+def _wrap(text, marker):
+    """Put emphasis markers around the text but outside its surrounding spaces"""
+    stripped = text.strip()
+    if not stripped:
+        return text
+    start = text.index(stripped[0])
+    return f"{text[:start]}{marker}{stripped}{marker}{text[start + len(stripped):]}"
+
+class MarkdownWriter:
+    extension = 'md'
+
+    def __init__(self, f, title):
+        self.f = f
+        self.in_list = False
+
+    def inline(self, segments):
+        parts = []
+        for segment in segments:
+            if segment.image:
+                parts.append(f"![{markdown_escape(segment.text)}]({segment.image})")
+                continue
+            text = markdown_escape(segment.text).replace('\t', ' ').replace('\n', '  \n')
+            if segment.bold:
+                text = _wrap(text, '**')
+            if segment.italic:
+                text = _wrap(text, '*')
+            parts.append(text)
+        return ''.join(parts).strip()
+
+    def _block(self, text):
+        if self.in_list:
+            self.f.write('\n')
+            self.in_list = False
+        self.f.write(text + '\n\n')
+
+    def heading(self, level, text):
+        self._block(f"{'#' * min(level, 6)} {markdown_escape(text)}")
+
+    def paragraph(self, segments):
+        self._block(self.inline(segments))
+
+    def list_item(self, ordered, level, segments):
+        self.f.write(f"{'    ' * level}{'1.' if ordered else '-'} {self.inline(segments)}\n")
+        self.in_list = True
+
+    def table(self, rows):
+        if not rows:
+            return
+        lines = ['| ' + ' | '.join(markdown_escape(cell).replace('\n', '<br>') for cell in row) + ' |'
+                 for row in rows]
+        lines.insert(1, '|' + ' --- |' * len(rows[0]))
+        self._block('\n'.join(lines))
+
+    def close(self):
+        if self.in_list:
+            self.f.write('\n')
+
+class HTMLWriter:
+    extension = 'html'
+
+    def __init__(self, f, title):
+        self.f = f
+        # Open lists as [tag, item open?], outermost first
+        self.lists = []
+        f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+                '<meta name="viewport" content="width=device-width, initial-scale=1">\n'
+                f'<title>{html_escape(title)}</title>\n</head>\n<body>\n'
+                '<nav><a href="index.html">Contents</a></nav>\n<main>\n')
+
+    def inline(self, segments):
+        parts = []
+        for segment in segments:
+            if segment.image:
+                parts.append(f'<img src="{html_escape(segment.image)}" alt="{html_escape(segment.text)}">')
+                continue
+            text = html_escape(segment.text).replace('\n', '<br>')
+            if segment.bold:
+                text = f'<strong>{text}</strong>'
+            if segment.italic:
+                text = f'<em>{text}</em>'
+            parts.append(text)
+        return ''.join(parts).strip()
+
+    def _close_lists(self, depth=0):
+        while len(self.lists) > depth:
+            tag, item_open = self.lists.pop()
+            self.f.write(f"{'</li>' if item_open else ''}</{tag}>\n")
+
+    def heading(self, level, text):
+        self._close_lists()
+        level = min(level, 6)
+        self.f.write(f'<h{level} id="{slugify(text)}">{html_escape(text)}</h{level}>\n')
+
+    def paragraph(self, segments):
+        self._close_lists()
+        self.f.write(f'<p>{self.inline(segments)}</p>\n')
+
+    def list_item(self, ordered, level, segments):
+        tag = 'ol' if ordered else 'ul'
+        self._close_lists(level + 1)
+        if len(self.lists) == level + 1 and self.lists[-1][0] != tag:
+            self._close_lists(level)
+        while len(self.lists) < level + 1:
+            self.f.write(f'<{tag}>\n')
+            self.lists.append([tag, False])
+        if self.lists[-1][1]:
+            self.f.write('</li>\n')
+        self.f.write(f'<li>{self.inline(segments)}')
+        self.lists[-1][1] = True
+
+    def table(self, rows):
+        self._close_lists()
+        self.f.write('<table>\n')
+        for n, row in enumerate(rows):
+            cell_tag = 'th' if n == 0 else 'td'
+            cells = ''.join(f'<{cell_tag}>{html_escape(cell).replace(chr(10), "<br>")}</{cell_tag}>'
+                            for cell in row)
+            self.f.write(f'<tr>{cells}</tr>\n')
+        self.f.write('</table>\n')
+
+    def close(self):
+        self._close_lists()
+        self.f.write('</main>\n</body>\n</html>\n')
+
+WRITERS = {'markdown': MarkdownWriter, 'html': HTMLWriter}
+
+class ReportExporter:
+    """Write body blocks to one file per chapter as they stream past.
+
+    Only the current block, the open chapter file and the list of
+    chapter titles are held, so memory does not grow with the report.
+    """
+
+    def __init__(self, archive, document_name, output_dir, writer_class, split_level):
+        self.archive = archive
+        self.output_dir = output_dir
+        self.writer_class = writer_class
+        self.split_level = split_level
+        self.styles = read_styles(archive, document_name)
+        self.list_formats = read_list_formats(archive, document_name)
+        self.images = {rel_id: member for rel_id, (rel_type, member)
+                       in part_relationships(archive, document_name).items() if rel_type == REL_TYPE_IMAGE}
+        self.extracted = {}
+        self.chapters = []
+        self.file = None
+        self.writer = None
+        self.tables = 0
+
+    def _open_chapter(self, title):
+        self.close()
+        name = f"{len(self.chapters):02d}-{slugify(title)}.{self.writer_class.extension}"
+        self.chapters.append((title, name))
+        self.file = open(os.path.join(self.output_dir, name), 'w', encoding='utf-8')
+        self.writer = self.writer_class(self.file, title)
+
+    def close(self):
+        if self.file is not None:
+            self.writer.close()
+            self.file.close()
+            self.file = None
+
+    def _extract_image(self, rel_id):
+        """Copy an image member out once and return its path relative to the chapters"""
+        member = self.images.get(rel_id)
+        if member is None:
+            return None
+        if member not in self.extracted:
+            name = posixpath.basename(member)
+            os.makedirs(os.path.join(self.output_dir, IMAGE_DIR), exist_ok=True)
+            with self.archive.open(member) as source, \
+                    open(os.path.join(self.output_dir, IMAGE_DIR, name), 'wb') as target:
+                shutil.copyfileobj(source, target)
+            self.extracted[member] = f"{IMAGE_DIR}/{name}"
+        return self.extracted[member]
+
+    def segments(self, paragraph):
+        segments = []
+        for run in iter_runs(paragraph):
+            for blip in run.iter(A_BLIP):
+                source = self._extract_image(blip.get(R_EMBED))
+                if source:
+                    properties = next(run.iter(WP_DOCPR), None)
+                    alt = '' if properties is None else properties.get('descr') or properties.get('name', '')
+                    segments.append(Segment(alt, image=source))
+            text = run_text(run)
+            if not text:
+                continue
+            bold, italic = _toggle(run, W_BOLD_PATH), _toggle(run, W_ITALIC_PATH)
+            previous = segments[-1] if segments else None
+            if previous and not previous.image and (previous.bold, previous.italic) == (bold, italic):
+                previous.text += text
+            else:
+                segments.append(Segment(text, bold, italic))
+        return segments
+
+    def block(self, block):
+        if block.tag == W_TBL:
+            if self.writer is None:
+                self._open_chapter(FRONT_MATTER)
+            self.writer.table(table_rows(block, fill_merged=False))
+            self.tables += 1
+            return
+        if block.tag != W_P:
+            return
+        style_id = paragraph_style_id(block)
+        level = self.styles.level(style_id)
+        if level:
+            text = ' '.join(paragraph_text(block).split())
+            if text:
+                if level <= self.split_level or self.writer is None:
+                    self._open_chapter(text)
+                self.writer.heading(level, text)
+                return
+        segments = self.segments(block)
+        if not segments:
+            return
+        if self.writer is None:
+            self._open_chapter(FRONT_MATTER)
+        numbering = block.find(W_NUMPR_PATH)
+        number_id = None if numbering is None else numbering.find(W_NUM_ID)
+        if number_id is not None and number_id.get(W_VAL) != '0':
+            list_level = numbering.find(W_ILVL)
+            depth = 0 if list_level is None else int(list_level.get(W_VAL, 0))
+            ordered = self.list_formats.get(number_id.get(W_VAL), {}).get(depth, False)
+            self.writer.list_item(ordered, depth, segments)
+        else:
+            self.writer.paragraph(segments)
+
+    def write_index(self, title):
+        extension = self.writer_class.extension
+        with open(os.path.join(self.output_dir, f'index.{extension}'), 'w', encoding='utf-8') as f:
+            if extension == 'md':
+                f.write(f"# {markdown_escape(title)}\n\n")
+                for chapter, name in self.chapters:
+                    f.write(f"- [{markdown_escape(chapter)}]({name})\n")
+                return
+            f.write(f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n'
+                    f'<title>{html_escape(title)}</title>\n</head>\n<body>\n'
+                    f'<h1>{html_escape(title)}</h1>\n<ol>\n')
+            for chapter, name in self.chapters:
+                f.write(f'<li><a href="{html_escape(name)}">{html_escape(chapter)}</a></li>\n')
+            f.write('</ol>\n</body>\n</html>\n')
+
+def export_report(path, output_dir, output_format='markdown', split_level=1, title=None):
+    """Export a report to per-chapter Markdown or HTML files plus an index.
+
+    Chapter files from an earlier export in output_dir are removed first.
+    Returns the exporter, which records the chapters, images and tables.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for stale in glob.glob(os.path.join(output_dir, '*')):
+        if CHAPTER_FILE.match(os.path.basename(stale)):
+            os.remove(stale)
+    title = title or os.path.splitext(os.path.basename(path))[0]
+    with DocxPackage(path) as archive:
+        document_name = main_document_name(archive)
+        exporter = ReportExporter(archive, document_name, output_dir, WRITERS[output_format], split_level)
+        try:
+            with archive.open(document_name) as source:
+                for block in iter_body_blocks(source):
+                    exporter.block(block)
+        finally:
+            exporter.close()
+    exporter.write_index(title)
+    return exporter
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='export_docx',
+                                     description='Export a .docx report to per-chapter Markdown or HTML.')
+    parser.add_argument('path', help='.docx report to export')
+    parser.add_argument('-o', '--output-dir', default=os.path.join('public', 'report'),
+                        help='output directory (default: public/report, published with the site build)')
+    parser.add_argument('--format', choices=sorted(WRITERS), default='html', help='output format (default: html)')
+    parser.add_argument('--split-level', type=int, default=1,
+                        help='start a new file at headings up to this level (default: 1)')
+    parser.add_argument('--title', help='title for the index page (default: the file name)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    exporter = export_report(args.path, args.output_dir, args.format, args.split_level, args.title)
+    print(f"Exported {len(exporter.chapters)} chapter(s), {exporter.tables} table(s) and "
+          f"{len(exporter.extracted)} image(s) to {args.output_dir} "
+          f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,55 @@
+import hashlib
+import inspect
+import io
+import math
+import os
+from xml.sax.saxutils import escape
+
+import docx
 from docx import Document
-from docx.shared import Pt, Inches, RGBColor
+from docx.shared import Emu, Pt, Inches, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import nsdecls, qn
+from docx.oxml import OxmlElement, parse_xml
+from docx.table import Table
+
+from cocomo import COST_PER_PERSON_MONTH, KLOC_SPREAD, MODES, ORGANIC, PERCENTILES, sensitivity, simulate
+from count_loc import measure_sources
+from docx_package import write_atomic
+
+OUTPUT_PATH = 'IVARS_COCOMO_Estimation.docx'
+REPORT_FONT = 'Times New Roman'
+BODY_SIZE = Pt(12)
+HEADING_SIZE = Pt(14)
+
+# Paragraph styles: name -> (based on, alignment, bold)
+PARAGRAPH_STYLES = {
+    'Report Title': ('Normal', WD_ALIGN_PARAGRAPH.CENTER, False),
+    'Report Body': ('Normal', WD_ALIGN_PARAGRAPH.JUSTIFY, False),
+    'Report Caption': ('Normal', WD_ALIGN_PARAGRAPH.CENTER, False),
+    'Report Equation': ('Normal', WD_ALIGN_PARAGRAPH.CENTER, False),
+    'Report Result': ('Normal', None, True),
+    'Report Formula': ('List Bullet', None, True),
+    'Report Table Text': ('Normal', WD_ALIGN_PARAGRAPH.LEFT, False),
+    'Report Table Value': ('Normal', WD_ALIGN_PARAGRAPH.CENTER, False),
+}
+STRONG_STYLE = 'Report Strong'
+TABLE_STYLE = 'Report Table'
+
+# The application sources sit next to this script
+SOURCE_ROOT = os.path.dirname(os.path.abspath(__file__))
+# Static opening pages, built once per builder class and then cloned
+SKELETON_CACHE_DIR = os.path.join(SOURCE_ROOT, '.render-cache')
+# Relative sizes tabulated in the cost sensitivity table
+SENSITIVITY_SIZES = (0.8, 0.9, 1.0, 1.1, 1.2)
 
 def add_page_border(section):
     """Add a border to the page"""
     sectPr = section._sectPr
     pgBorders = OxmlElement('w:pgBorders')
     pgBorders.set(qn('w:offsetFrom'), 'page')
-    
+
     for border_name in ('top', 'left', 'bottom', 'right'):
         border_el = OxmlElement(f'w:{border_name}')
         border_el.set(qn('w:val'), 'single')
@@ -17,12 +57,151 @@ def add_page_border(section):
         border_el.set(qn('w:space'), '24')
         border_el.set(qn('w:color'), '8B0000')
         pgBorders.append(border_el)
-    
+
     sectPr.append(pgBorders)
 
-def create_cocomo_document():
+def use_report_font(style, size):
+    """Set a style's font, dropping theme fonts that would take precedence"""
+    style.font.name = REPORT_FONT
+    style.font.size = size
+    fonts = style.element.rPr.rFonts
+    for attribute in ('w:asciiTheme', 'w:hAnsiTheme'):
+        fonts.attrib.pop(qn(attribute), None)
+
+class ReportBuilder:
+    """Add report content by style name.
+
+    The report's paragraph, character and table styles are defined once in
+    styles.xml, so paragraphs and runs carry only a style ID instead of
+    repeating font, size and alignment on every run.
+    """
+
+    def __init__(self, doc, define_styles=True):
+        self.doc = doc
+        # Style name -> style ID. python-docx resolves names by scanning
+        # styles.xml on every assignment, so content is styled by ID instead.
+        self.style_ids = {}
+        if define_styles:
+            self.define_styles()
+        else:
+            # A document cloned from the skeleton already has the styles
+            self.style_ids = {style.name: style.style_id for style in doc.styles}
+
+    def define_styles(self):
+        styles = self.doc.styles
+        use_report_font(styles['Normal'], BODY_SIZE)
+        heading = styles['Heading 1']
+        use_report_font(heading, HEADING_SIZE)
+        heading.font.bold = True
+        for level in (1, 2, 3):
+            self.style_ids[f'Heading {level}'] = styles[f'Heading {level}'].style_id
+
+        for name, (base, alignment, bold) in PARAGRAPH_STYLES.items():
+            style = styles.add_style(name, WD_STYLE_TYPE.PARAGRAPH)
+            style.base_style = styles[base]
+            self.style_ids[name] = style.style_id
+            if alignment is not None:
+                style.paragraph_format.alignment = alignment
+            if bold:
+                style.font.bold = True
+
+        strong = styles.add_style(STRONG_STYLE, WD_STYLE_TYPE.CHARACTER)
+        strong.font.bold = True
+        self.style_ids[STRONG_STYLE] = strong.style_id
+
+        table = styles.add_style(TABLE_STYLE, WD_STYLE_TYPE.TABLE)
+        table.base_style = styles['Table Grid']
+        self.style_ids[TABLE_STYLE] = table.style_id
+        # Header rows are bold through the table style's first-row formatting
+        first_row = OxmlElement('w:tblStylePr')
+        first_row.set(qn('w:type'), 'firstRow')
+        run_properties = OxmlElement('w:rPr')
+        run_properties.append(OxmlElement('w:b'))
+        run_properties.append(OxmlElement('w:bCs'))
+        first_row.append(run_properties)
+        table.element.append(first_row)
+
+    def paragraph(self, text='', style=None):
+        paragraph = self.doc.add_paragraph(text)
+        if style is not None:
+            paragraph._p.style = self.style_ids[style]
+        return paragraph
+
+    def heading(self, text, level):
+        return self.paragraph(text, f'Heading {level}')
+
+    def page_break(self):
+        self.doc.add_page_break()
+
+    def table(self, header, rows=None, text_columns=(), strong_rows=(), columns=None):
+        """Add a bordered table with a bold header row, repeated on each page.
+
+        Pass rows as a list of rows, or columns as equal-length sequences
+        (NumPy arrays included) instead. Cells in text_columns are
+        left-aligned and the rest centered; data rows whose index is in
+        strong_rows are bold. The w:tbl element is written as one XML
+        string: filling python-docx's cells one at a time re-reads the
+        table grid per access, which is quadratic in the row count.
+        """
+        if columns is not None:
+            rows = zip(*columns)
+        width = Emu(self.doc._block_width // len(header)).twips
+        text_style, value_style = self.style_ids['Report Table Text'], self.style_ids['Report Table Value']
+        strong_style = self.style_ids[STRONG_STYLE]
+        cell_starts = [f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+                       f'<w:p><w:pPr><w:pStyle w:val="{text_style if column in text_columns else value_style}"/></w:pPr>'
+                       for column in range(len(header))]
+        header_start = (f'<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr>'
+                        f'<w:p><w:pPr><w:pStyle w:val="{value_style}"/></w:pPr>')
+
+        parts = [
+            f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblStyle w:val="{self.style_ids[TABLE_STYLE]}"/>'
+            '<w:tblW w:type="auto" w:w="0"/><w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" '
+            'w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>',
+            f'<w:gridCol w:w="{width}"/>' * len(header),
+            '</w:tblGrid><w:tr><w:trPr><w:tblHeader/></w:trPr>',
+        ]
+        for text in header:
+            parts += (header_start, _run_xml(text), '</w:p></w:tc>')
+        parts.append('</w:tr>')
+        for row_index, values in enumerate(rows):
+            run_style = strong_style if row_index in strong_rows else None
+            parts.append('<w:tr>')
+            for cell_start, value in zip(cell_starts, values):
+                parts += (cell_start, _run_xml(value, run_style), '</w:p></w:tc>')
+            parts.append('</w:tr>')
+        parts.append('</w:tbl>')
+
+        tbl = parse_xml(''.join(parts))
+        self.doc.element.body._insert_tbl(tbl)
+        return Table(tbl, self.doc._body)
+
+def _run_xml(value, style=None):
+    """A w:r holding value, or nothing for an empty cell"""
+    text = value if isinstance(value, str) else str(value)
+    if not text:
+        return ''
+    properties = f'<w:rPr><w:rStyle w:val="{style}"/></w:rPr>' if style else ''
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<w:r>{properties}<w:t{space}>{escape(text)}</w:t></w:r>'
+
+def percentile_table(report, simulation, output, digits, caption):
+    """One output's percentiles with a row per mode, the project's mode in bold"""
+    report.table(
+        ['Mode', *(f'P{p}' for p in PERCENTILES)],
+        [[mode.name, *(f'{simulation.value(mode, output, p):.{digits}f}' for p in PERCENTILES)]
+         for mode in MODES],
+        text_columns=(0,),
+        strong_rows=(MODES.index(ORGANIC),),
+    )
+    report.paragraph()
+    report.paragraph(caption, 'Report Caption')
+
+def build_skeleton(builder_class=ReportBuilder):
+    """The report's static opening: styles, page setup, title, introduction and model overview"""
     doc = Document()
-    
+    report = builder_class(doc)
+
     # Set up the document margins
     sections = doc.sections
     for section in sections:
@@ -31,73 +210,53 @@ def create_cocomo_document():
         section.left_margin = Inches(1.25)
         section.right_margin = Inches(1.25)
         add_page_border(section)
-    
+
     # Title
-    title = doc.add_paragraph()
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = title.add_run('Incident Verification and Response System')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    doc.add_paragraph()  # Empty line
-    
+    report.paragraph('Incident Verification and Response System', 'Report Title')
+
+    report.paragraph()  # Empty line
+
     # Main Heading
-    heading = doc.add_heading('COCOMO Cost Estimation', level=1)
-    heading.runs[0].font.size = Pt(14)
-    heading.runs[0].font.name = 'Times New Roman'
-    heading.runs[0].font.bold = True
-    
-    doc.add_paragraph()  # Empty line
-    
+    report.heading('COCOMO Cost Estimation', level=1)
+
+    report.paragraph()  # Empty line
+
     # Introduction paragraph
-    intro = doc.add_paragraph(
+    report.paragraph(
         "Effort and cost estimation is a crucial activity in software project management, as it helps in "
         "planning resources, scheduling activities, and estimating the overall project budget. For the "
         "Incident Verification and Response System (IVARS), the Basic COCOMO (Constructive Cost Model) "
-        "was used to estimate the development effort, time, team size, and cost."
+        "was used to estimate the development effort, time, team size, and cost.",
+        'Report Body'
     )
-    intro.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in intro.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    para2 = doc.add_paragraph(
+
+    report.paragraph(
         "The estimation considers only the manually written source code, excluding external libraries, "
         "frameworks, and auto-generated files. Based on project characteristics such as moderate size, "
         "well-understood requirements, and a small experienced team, the Organic mode of the Basic "
-        "COCOMO model was selected."
+        "COCOMO model was selected.",
+        'Report Body'
     )
-    para2.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in para2.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
+
     # Overview of Basic COCOMO Model
-    doc.add_heading('Overview of Basic COCOMO Model', level=2)
-    
-    overview = doc.add_paragraph(
+    report.heading('Overview of Basic COCOMO Model', level=2)
+
+    report.paragraph(
         "The Basic COCOMO model estimates software development effort and schedule primarily "
         "based on the size of the project measured in KLOC (Thousands of Lines of Code). It "
-        "classifies projects into three types: Organic, Semi-detached, and Embedded."
+        "classifies projects into three types: Organic, Semi-detached, and Embedded.",
+        'Report Body'
     )
-    overview.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in overview.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    para3 = doc.add_paragraph(
+
+    report.paragraph(
         "Since this project is a web-based application with moderate complexity and a flexible "
-        "development environment, it falls under the Organic project category."
+        "development environment, it falls under the Organic project category.",
+        'Report Body'
     )
-    para3.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in para3.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
+
     # Equations
-    equations_heading = doc.add_paragraph()
-    equations_heading.add_run('.The equations used are:').font.size = Pt(12)
-    
+    report.paragraph('.The equations used are:')
+
     # Bullet points for equations
     equations = [
         "Effort (E) = a × (KLOC)ᵇ (Person-Months)",
@@ -105,386 +264,267 @@ def create_cocomo_document():
         "Team Size = E / T",
         "Total Cost = Effort × Cost per Person-Month"
     ]
-    
+
     for eq in equations:
-        p = doc.add_paragraph(eq, style='List Bullet')
-        for run in p.runs:
-            run.font.size = Pt(12)
-            run.font.name = 'Times New Roman'
-            run.font.bold = True
-    
-    doc.add_paragraph()
-    
+        report.paragraph(eq, 'Report Formula')
+
+    return doc
+
+# builder class -> the saved skeleton package
+_skeletons = {}
+
+def _skeleton_path(builder_class, cache_dir):
+    """Cache path keyed by the code and settings the skeleton is built from.
+
+    The key hashes the source of build_skeleton, its helpers and every
+    class of the builder, plus the style settings and python-docx version,
+    so editing any of them builds a new skeleton. None when some of that
+    source is unavailable, e.g. for a builder defined interactively.
+    """
+    signature = hashlib.sha256()
+    builders = [cls for cls in builder_class.__mro__ if cls is not object]
+    for source in (build_skeleton, add_page_border, use_report_font, *builders):
+        try:
+            signature.update(inspect.getsource(source).encode('utf-8'))
+        except OSError:
+            return None
+    settings = (PARAGRAPH_STYLES, STRONG_STYLE, TABLE_STYLE, REPORT_FONT, BODY_SIZE, HEADING_SIZE, docx.__version__)
+    signature.update(repr(settings).encode('utf-8'))
+    digest = signature.hexdigest()[:16]
+    return os.path.join(cache_dir, f'cocomo-skeleton-{digest}.docx')
+
+def clone_skeleton(builder_class=ReportBuilder, cache_dir=SKELETON_CACHE_DIR):
+    """A fresh copy of the skeleton document to add the computed sections to.
+
+    The skeleton is kept as .docx bytes, in memory for repeated builds in
+    one process and under cache_dir so a new process only has to load it.
+    Loading the bytes is the clone: a deepcopy of a python-docx Document
+    splits its element tree from the one its part saves.
+    """
+    data = _skeletons.get(builder_class)
+    if data is None:
+        path = _skeleton_path(builder_class, cache_dir)
+        if path is not None and os.path.exists(path):
+            with open(path, 'rb') as f:
+                data = f.read()
+        else:
+            buffer = io.BytesIO()
+            build_skeleton(builder_class).save(buffer)
+            data = buffer.getvalue()
+            if path is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                write_atomic(path, data)
+        _skeletons[builder_class] = data
+    return Document(io.BytesIO(data))
+
+def build_cocomo_document(builder_class=ReportBuilder, size=None, simulation=None):
+    """Build the report.
+
+    size is a count_loc.SizeReport and simulation a cocomo.Simulation;
+    either is measured or run from the sources when omitted.
+    """
+    if size is None:
+        size = measure_sources(SOURCE_ROOT)
+    if simulation is None:
+        simulation = simulate(size.kloc)
+    low, high = PERCENTILES[0], PERCENTILES[-1]
+    effort = simulation.value(ORGANIC, 'effort')
+    team_size = math.ceil(simulation.value(ORGANIC, 'staff'))
+    cost = simulation.value(ORGANIC, 'cost')
+
+    doc = clone_skeleton(builder_class)
+    report = builder_class(doc, define_styles=False)
+
+    report.paragraph(
+        f"Rather than single values, each quantity is reported as the {low}th, {PERCENTILES[1]}th and "
+        f"{high}th percentile of {simulation.samples:,} Monte Carlo samples. The project size is drawn "
+        f"from a lognormal distribution around the measured size (σ = {KLOC_SPREAD:g}) and the cost per "
+        f"person-month from a triangular distribution between ₹{COST_PER_PERSON_MONTH[0]:g} and "
+        f"₹{COST_PER_PERSON_MONTH[2]:g} Lakhs, most likely ₹{COST_PER_PERSON_MONTH[1]:g} Lakhs.",
+        'Report Body'
+    )
+
+    report.paragraph()
+
     # Project Size Estimation
-    doc.add_page_break()
-    
-    heading2 = doc.add_heading('Project Size Estimation', level=2)
-    
-    intro_text = doc.add_paragraph(
+    report.page_break()
+
+    report.heading('Project Size Estimation', level=2)
+
+    report.paragraph(
         "The total size of the project was calculated by summing the lines of code developed across "
-        "different modules."
+        "different modules.",
+        'Report Body'
     )
-    intro_text.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in intro_text.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    doc.add_paragraph()
-    
+
+    report.paragraph()
+
     # Table 5.1: Project Size Estimation
-    table1 = doc.add_table(rows=5, cols=3)
-    table1.style = 'Table Grid'
-    
-    # Header row
-    hdr_cells = table1.rows[0].cells
-    hdr_cells[0].text = 'Module'
-    hdr_cells[1].text = 'Technology Used'
-    hdr_cells[2].text = 'Lines of Code (LOC)'
-    
-    # Make header bold and centered
-    for cell in hdr_cells:
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-        for run in cell.paragraphs[0].runs:
-            run.font.bold = True
-            run.font.size = Pt(12)
-            run.font.name = 'Times New Roman'
-    
-    # Data rows
-    data = [
-        ['Backend', 'Node.js / Express', '1,931'],
-        ['Frontend', 'React / TypeScript', '2,807'],
-        ['UI & Utilities', 'CSS / HTML', '1,006'],
-        ['Total', '', '5,744 LOC']
-    ]
-    
-    for i, row_data in enumerate(data, start=1):
-        row_cells = table1.rows[i].cells
-        for j, text in enumerate(row_data):
-            row_cells[j].text = text
-            row_cells[j].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER if j > 0 else WD_ALIGN_PARAGRAPH.LEFT
-            for run in row_cells[j].paragraphs[0].runs:
-                run.font.size = Pt(12)
-                run.font.name = 'Times New Roman'
-                if i == 4:  # Total row
-                    run.font.bold = True
-    
-    # Add another row for Project Size
-    row = table1.add_row()
-    row.cells[0].text = 'Project Size'
-    row.cells[2].text = '5.7 KLOC'
-    for cell in row.cells:
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER if cell != row.cells[0] else WD_ALIGN_PARAGRAPH.LEFT
-        for run in cell.paragraphs[0].runs:
-            run.font.size = Pt(12)
-            run.font.name = 'Times New Roman'
-            run.font.bold = True
-    
-    doc.add_paragraph()
-    
+    report.table(
+        ['Module', 'Technology Used', 'Lines of Code (LOC)'],
+        [
+            *([bucket.module, bucket.technology, f'{counts.code:,}'] for bucket, counts in size.modules),
+            ['Total', '', f'{size.total:,} LOC'],
+            ['Project Size', '', f'{size.kloc:.1f} KLOC'],
+        ],
+        text_columns=(0,),
+        strong_rows=(len(size.modules), len(size.modules) + 1),
+    )
+
+    report.paragraph()
+
     # Table caption
-    caption = doc.add_paragraph()
-    caption.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = caption.add_run('Table 5.1: Project Size Estimation')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
+    report.paragraph('Table 5.1: Project Size Estimation', 'Report Caption')
+
     # Page 3
-    doc.add_page_break()
-    
+    report.page_break()
+
     # COCOMO Model Constants
-    doc.add_heading('COCOMO Model Constants (Organic Mode)', level=2)
-    
-    constants_intro = doc.add_paragraph(
-        "Based on the COCOMO reference values provided in the model documentation:"
+    report.heading('COCOMO Model Constants', level=2)
+
+    report.paragraph(
+        "Based on the COCOMO reference values provided in the model documentation. The project is "
+        "estimated in Organic mode; the other modes are shown for comparison.",
+        'Report Body'
     )
-    for run in constants_intro.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    doc.add_paragraph()
-    
+
+    report.paragraph()
+
     # Table 5.2: Constants
-    table2 = doc.add_table(rows=5, cols=2)
-    table2.style = 'Table Grid'
+    table2 = report.table(
+        ['Parameter', *(mode.name for mode in MODES)],
+        [[name, *(f'{getattr(mode, name):g}' for mode in MODES)] for name in 'abcd'],
+    )
     table2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    
-    # Header
-    hdr_cells2 = table2.rows[0].cells
-    hdr_cells2[0].text = 'Parameter'
-    hdr_cells2[1].text = 'Value'
-    
-    for cell in hdr_cells2:
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-        for run in cell.paragraphs[0].runs:
-            run.font.bold = True
-            run.font.size = Pt(12)
-            run.font.name = 'Times New Roman'
-    
-    # Constants data
-    constants = [
-        ['a', '2.4'],
-        ['b', '1.05'],
-        ['c', '2.5'],
-        ['d', '0.38']
-    ]
-    
-    for i, const_data in enumerate(constants, start=1):
-        cells = table2.rows[i].cells
-        cells[0].text = const_data[0]
-        cells[1].text = const_data[1]
-        for cell in cells:
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-            for run in cell.paragraphs[0].runs:
-                run.font.size = Pt(12)
-                run.font.name = 'Times New Roman'
-    
-    doc.add_paragraph()
-    
-    caption2 = doc.add_paragraph()
-    caption2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = caption2.add_run('Table 5.2: Organic Model Constants')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
+
+    report.paragraph()
+
+    report.paragraph('Table 5.2: Basic COCOMO Model Constants', 'Report Caption')
+
     # Effort Estimation
-    doc.add_heading('Effort Estimation', level=2)
-    
-    effort_para = doc.add_paragraph(
+    report.heading('Effort Estimation', level=2)
+
+    report.paragraph(
         "Effort represents the total amount of work required to develop the software, measured in "
-        "person-months."
+        "person-months.",
+        'Report Body'
     )
-    effort_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in effort_para.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    calc_heading = doc.add_paragraph()
-    run = calc_heading.add_run('Calculation:')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    calc1 = doc.add_paragraph()
-    calc1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = calc1.add_run('E=2.4×(5.7)¹·⁰⁵')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    calc2 = doc.add_paragraph()
-    calc2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = calc2.add_run('E=14.89 Person-Months')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    result_heading = doc.add_paragraph()
-    run = result_heading.add_run('Result:')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    result = doc.add_paragraph()
-    run = result.add_run('Estimated Effort ≈ 15 Person-Months')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
+
+    percentile_table(report, simulation, 'effort', 2, 'Table 5.3: Effort Percentiles (Person-Months)')
+    report.paragraph('Result:', 'Report Result')
+    report.paragraph(f'Estimated Effort ≈ {round(effort)} Person-Months', 'Report Result')
+
     # Development Time Estimation
-    doc.add_heading('Development Time Estimation', level=2)
-    
-    time_para = doc.add_paragraph(
-        "Development time indicates the total calendar time required to complete the project."
+    report.heading('Development Time Estimation', level=2)
+
+    report.paragraph(
+        "Development time indicates the total calendar time required to complete the project.",
+        'Report Body'
     )
-    time_para.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in time_para.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    calc_heading2 = doc.add_paragraph()
-    run = calc_heading2.add_run('Calculation:')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    calc3 = doc.add_paragraph()
-    calc3.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = calc3.add_run('T=2.5×(14.89)⁰·³⁸')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    calc4 = doc.add_paragraph()
-    calc4.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = calc4.add_run('T=6.79 months')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    time_result = doc.add_paragraph(
+
+    percentile_table(report, simulation, 'time', 2, 'Table 5.4: Development Time Percentiles (Months)')
+
+    report.paragraph(
         "Considering parallel development and efficient task distribution, the effective development "
-        "duration was approximately 5.3 months, which closely matches the actual project timeline."
+        "duration was approximately 5.3 months, which closely matches the actual project timeline.",
+        'Report Body'
     )
-    time_result.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in time_result.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
+
     # Page 4
-    doc.add_page_break()
-    
+    report.page_break()
+
     # Team Size Estimation
-    doc.add_heading('Team Size Estimation', level=2)
-    
-    team_intro = doc.add_paragraph(
-        "The estimated number of developers required is calculated as:"
-    )
-    team_intro.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in team_intro.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    team_calc = doc.add_paragraph()
-    team_calc.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = team_calc.add_run('Team Size=14.89/6.79 ≈2.19')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    result_heading2 = doc.add_paragraph()
-    run = result_heading2.add_run('Result:')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    team_result = doc.add_paragraph()
-    run = team_result.add_run('Estimated Team Size ≈ 3 members')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    actual_team = doc.add_paragraph(
+    report.heading('Team Size Estimation', level=2)
+
+    report.paragraph("The estimated number of developers required is calculated as E / T:", 'Report Body')
+    percentile_table(report, simulation, 'staff', 2, 'Table 5.5: Team Size Percentiles (Members)')
+    report.paragraph('Result:', 'Report Result')
+    report.paragraph(f'Estimated Team Size ≈ {team_size} members', 'Report Result')
+
+    report.paragraph(
         "The actual team consisted of 4 members, which ensured better workload sharing and timely "
-        "completion."
+        "completion.",
+        'Report Body'
     )
-    actual_team.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in actual_team.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    doc.add_paragraph()
-    
+
+    report.paragraph()
+
     # Cost Estimation
-    doc.add_heading('Cost Estimation', level=2)
-    
-    cost_intro = doc.add_paragraph(
+    report.heading('Cost Estimation', level=2)
+
+    report.paragraph(
         "The total project cost is calculated based on the estimated effort and average cost per person-"
-        "month."
+        "month.",
+        'Report Body'
     )
-    cost_intro.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
-    for run in cost_intro.runs:
-        run.font.size = Pt(12)
-        run.font.name = 'Times New Roman'
-    
-    assumption = doc.add_paragraph()
-    run = assumption.add_run('Assumption:')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    cost_assumption = doc.add_paragraph()
-    run = cost_assumption.add_run('Average cost per person-month = ₹ 4.2 Lakhs')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    calc_heading3 = doc.add_paragraph()
-    run = calc_heading3.add_run('Calculation:')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    cost_calc = doc.add_paragraph()
-    cost_calc.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = cost_calc.add_run('Total Cost=15×4.2=63 Lakhs')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    result_heading3 = doc.add_paragraph()
-    run = result_heading3.add_run('Result:')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    cost_result = doc.add_paragraph()
-    run = cost_result.add_run('Estimated Project Cost ≈ ₹63 Lakhs')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    run.font.bold = True
-    
-    doc.add_paragraph()
-    
+
+    percentile_table(report, simulation, 'cost', 1, 'Table 5.6: Project Cost Percentiles (₹ Lakhs)')
+    report.paragraph('Result:', 'Report Result')
+    report.paragraph(f'Estimated Project Cost ≈ ₹{cost:.1f} Lakhs', 'Report Result')
+
+    report.paragraph()
+
+    report.paragraph(
+        "The sensitivity of the Organic estimate to the project size and the cost per person-month is "
+        "shown below.",
+        'Report Body'
+    )
+
+    sizes = [size.kloc * factor for factor in SENSITIVITY_SIZES]
+    grid = sensitivity(ORGANIC, sizes, COST_PER_PERSON_MONTH)
+    report.table(
+        ['Project Size', *(f'₹{rate:g} Lakhs/PM' for rate in COST_PER_PERSON_MONTH)],
+        [[f'{kloc:.1f} KLOC', *(f'{value:.1f}' for value in row)] for kloc, row in zip(sizes, grid)],
+        text_columns=(0,),
+        strong_rows=(SENSITIVITY_SIZES.index(1.0),),
+    )
+
+    report.paragraph()
+
+    report.paragraph('Table 5.7: Organic Cost Sensitivity (₹ Lakhs)', 'Report Caption')
+
+    report.paragraph()
+
     # Summary Table
-    doc.add_heading('Summary of Estimation Results', level=2)
-    
-    # Table 5.3: Summary
-    table3 = doc.add_table(rows=7, cols=2)
-    table3.style = 'Table Grid'
-    
-    # Header
-    hdr_cells3 = table3.rows[0].cells
-    hdr_cells3[0].text = 'Parameter'
-    hdr_cells3[1].text = 'Estimated Value'
-    
-    for cell in hdr_cells3:
-        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-        for run in cell.paragraphs[0].runs:
-            run.font.bold = True
-            run.font.size = Pt(12)
-            run.font.name = 'Times New Roman'
-    
-    # Summary data
-    summary_data = [
-        ['Project Type', 'Organic'],
-        ['Project Size', '5.7 KLOC'],
-        ['Effort', '~15 Person-Months'],
-        ['Development Time', '~5.3 Months'],
-        ['Team Size', '~3 Members'],
-        ['Estimated Cost', '~₹63 Lakhs']
-    ]
-    
-    for i, sum_data in enumerate(summary_data, start=1):
-        cells = table3.rows[i].cells
-        cells[0].text = sum_data[0]
-        cells[1].text = sum_data[1]
-        for cell in cells:
-            cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER if cell == cells[1] else WD_ALIGN_PARAGRAPH.LEFT
-            for run in cell.paragraphs[0].runs:
-                run.font.size = Pt(12)
-                run.font.name = 'Times New Roman'
-    
-    doc.add_paragraph()
-    
-    caption3 = doc.add_paragraph()
-    caption3.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = caption3.add_run('Table 5.3: COCOMO Estimation Summary')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    doc.add_paragraph()
-    doc.add_paragraph()
-    
+    report.heading('Summary of Estimation Results', level=2)
+
+    # Table 5.8: Summary
+    report.table(
+        ['Parameter', 'Estimated Value'],
+        [
+            ['Project Type', 'Organic'],
+            ['Project Size', f'{size.kloc:.1f} KLOC'],
+            ['Effort', f'~{round(effort)} Person-Months (P{low}–P{high}: '
+                       f'{simulation.value(ORGANIC, "effort", low):.0f}–'
+                       f'{simulation.value(ORGANIC, "effort", high):.0f})'],
+            ['Development Time', '~5.3 Months'],
+            ['Team Size', f'~{team_size} Members'],
+            ['Estimated Cost', f'~₹{cost:.0f} Lakhs (P{low}–P{high}: '
+                               f'₹{simulation.value(ORGANIC, "cost", low):.0f}–'
+                               f'{simulation.value(ORGANIC, "cost", high):.0f})']
+        ],
+        text_columns=(0,),
+    )
+
+    report.paragraph()
+
+    report.paragraph('Table 5.8: COCOMO Estimation Summary', 'Report Caption')
+
+    report.paragraph()
+    report.paragraph()
+
     # Footer
-    footer = doc.add_paragraph()
-    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = footer.add_run('Dept. of CSE,BITM,Ballari')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
-    page_num = doc.add_paragraph()
+    report.paragraph('Dept. of CSE,BITM,Ballari', 'Report Caption')
+
+    page_num = report.paragraph('Page 14')
     page_num.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-    run = page_num.add_run('Page 14')
-    run.font.size = Pt(12)
-    run.font.name = 'Times New Roman'
-    
+
+    return doc
+
+def create_cocomo_document(output_path=OUTPUT_PATH):
     # Save the document
-    doc.save('IVARS_COCOMO_Estimation.docx')
-    print("✅ Document created successfully: IVARS_COCOMO_Estimation.docx")
+    build_cocomo_document().save(output_path)
+    print(f"✅ Document created successfully: {output_path}")
 
 if __name__ == "__main__":
     create_cocomo_document()
@@ -0,0 +1,383 @@
+import argparse
+import hashlib
+import io
+import math
+import os
+import posixpath
+import shutil
+import struct
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+from lxml import etree
+
+from docx_package import (
+    REL_TYPE_IMAGE,
+    RELATIONSHIP,
+    read_relationships,
+    relative_target,
+    rels_source_part,
+    repackage_docx,
+    resolve_target,
+)
+from read_docx import A_BLIP, R_EMBED
+
+CONTENT_TYPES_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+WP_NS = 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing'
+
+CT_OVERRIDE = f'{{{CONTENT_TYPES_NS}}}Override'
+WP_INLINE = f'{{{WP_NS}}}inline'
+WP_ANCHOR = f'{{{WP_NS}}}anchor'
+WP_EXTENT = f'{{{WP_NS}}}extent'
+
+CONTENT_TYPES_NAME = '[Content_Types].xml'
+EMU_PER_INCH = 914400
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# JPEG start-of-frame markers carrying the image size
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+@dataclass(slots=True)
+class Usage:
+    rels_name: str
+    source_part: str
+    rel_id: str
+
+@dataclass(slots=True)
+class MediaItem:
+    name: str
+    size: int
+    compressed_size: int
+    sha256: str
+    pixels: tuple | None
+    usages: list = field(default_factory=list)
+    extent: tuple | None = None
+    duplicate_of: str | None = None
+
+    @property
+    def dpi(self):
+        """Effective horizontal DPI at the largest size the image is displayed"""
+        if not (self.pixels and self.extent and self.extent[0]):
+            return None
+        return self.pixels[0] / (self.extent[0] / EMU_PER_INCH)
+
+def image_pixels(data):
+    """(width, height) of a PNG or JPEG, read from its header"""
+    if data.startswith(PNG_SIGNATURE) and data[12:16] == b'IHDR':
+        return struct.unpack('>II', data[16:24])
+    if data.startswith(b'\xff\xd8'):
+        position = 2
+        while position + 9 <= len(data) and data[position] == 0xFF:
+            marker = data[position + 1]
+            length = struct.unpack('>H', data[position + 2:position + 4])[0]
+            if marker in JPEG_SOF_MARKERS:
+                height, width = struct.unpack('>HH', data[position + 5:position + 9])
+                return width, height
+            position += 2 + length
+    return None
+
+def display_extents(archive, part):
+    """Largest displayed (cx, cy) in EMUs for each image rId used by a part"""
+    extents = {}
+    with archive.open(part) as source:
+        for _, drawing in etree.iterparse(source, events=('end',), tag=(WP_INLINE, WP_ANCHOR)):
+            extent = drawing.find(WP_EXTENT)
+            if extent is not None:
+                size = (int(extent.get('cx', 0)), int(extent.get('cy', 0)))
+                for blip in drawing.iter(A_BLIP):
+                    rel_id = blip.get(R_EMBED)
+                    if rel_id:
+                        current = extents.get(rel_id, (0, 0))
+                        extents[rel_id] = (max(current[0], size[0]), max(current[1], size[1]))
+            drawing.clear()
+    return extents
+
+def inventory_media(path):
+    """Media parts of a report with their hash, pixel size, uses and display size.
+
+    Returns (items, relationships), items keyed by member name. An item is
+    marked as a duplicate of the first (by name) used item with the same
+    bytes, or of the first item when none of the copies is used.
+    """
+    with zipfile.ZipFile(path) as archive:
+        relationships = read_relationships(archive)
+        items = {}
+        usages = {}
+        for rels_name, rels in relationships.items():
+            source_part = rels_source_part(rels_name)
+            for rel in rels.iter(RELATIONSHIP):
+                if rel.get('Type') == REL_TYPE_IMAGE and rel.get('TargetMode') != 'External':
+                    member = resolve_target(source_part, rel.get('Target'))
+                    usages.setdefault(member, []).append(Usage(rels_name, source_part, rel.get('Id')))
+
+        members = {info.filename: info for info in archive.infolist()}
+        names = sorted(name for name in members
+                       if name in usages or posixpath.dirname(name) == 'word/media')
+        for name in names:
+            if name not in members:
+                continue
+            data = archive.read(name)
+            info = members[name]
+            items[name] = MediaItem(name, info.file_size, info.compress_size,
+                                    hashlib.sha256(data).hexdigest(), image_pixels(data),
+                                    usages.get(name, []))
+
+        parts = {usage.source_part for item in items.values() for usage in item.usages}
+        for part in sorted(parts):
+            if part not in members:
+                continue
+            extents = display_extents(archive, part)
+            for item in items.values():
+                for usage in item.usages:
+                    if usage.source_part == part and usage.rel_id in extents:
+                        cx, cy = extents[usage.rel_id]
+                        current = item.extent or (0, 0)
+                        item.extent = (max(current[0], cx), max(current[1], cy))
+
+    # Prefer a copy something uses, so --drop-unused never removes the
+    # member the duplicates are repointed at
+    canonical_by_hash = {}
+    for item in items.values():
+        current = canonical_by_hash.get(item.sha256)
+        if current is None or (item.usages and not current.usages):
+            canonical_by_hash[item.sha256] = item
+    for item in items.values():
+        item.duplicate_of = canonical_by_hash[item.sha256].name
+        if item.duplicate_of == item.name:
+            item.duplicate_of = None
+        else:
+            canonical = items[item.duplicate_of]
+            if item.extent:
+                current = canonical.extent or (0, 0)
+                canonical.extent = (max(current[0], item.extent[0]), max(current[1], item.extent[1]))
+    return items, relationships
+
+def _recompress_png(name, data, max_width, dpi):
+    """Re-encode a PNG, downscaled to max_width pixels when it is wider.
+
+    Returns (name, new bytes) when that is smaller than the original,
+    otherwise (name, None).
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        save_options = {'optimize': True}
+        if max_width and image.width > max_width:
+            height = max(1, round(image.height * max_width / image.width))
+            image = image.resize((max_width, height), Image.LANCZOS)
+            save_options['dpi'] = (dpi, dpi)
+        output = io.BytesIO()
+        image.save(output, format='PNG', **save_options)
+    encoded = output.getvalue()
+    return name, encoded if len(encoded) < len(data) else None
+
+@dataclass(slots=True)
+class OptimizeResult:
+    input_size: int
+    output_size: int
+    deduplicated: list
+    dropped: list
+    recompressed: list
+
+def plan_deduplication(items, relationships, drop_unused=False):
+    """Repoint duplicate images at their first copy and list members to drop.
+
+    Returns (changed rels names, dropped member names); the relationship
+    trees are edited in place.
+    """
+    changed = set()
+    dropped = []
+    for item in items.values():
+        if item.duplicate_of:
+            for usage in item.usages:
+                rels = relationships[usage.rels_name]
+                for rel in rels.iter(RELATIONSHIP):
+                    if rel.get('Id') == usage.rel_id:
+                        rel.set('Target', relative_target(usage.source_part, item.duplicate_of))
+                changed.add(usage.rels_name)
+            dropped.append(item.name)
+        elif drop_unused and not item.usages:
+            dropped.append(item.name)
+    return changed, dropped
+
+def _content_types_without(archive, dropped):
+    """[Content_Types].xml bytes without overrides for dropped parts, or None if unchanged"""
+    root = etree.fromstring(archive.read(CONTENT_TYPES_NAME))
+    removed = False
+    for override in list(root.iter(CT_OVERRIDE)):
+        if override.get('PartName', '').lstrip('/') in dropped:
+            root.remove(override)
+            removed = True
+    return etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True) if removed else None
+
+def _member_footprint(info):
+    """Bytes a member takes in the archive: local header, data and directory entry"""
+    name_length = len(info.filename.encode('utf-8'))
+    extra_length = len(info.extra)
+    return (zipfile.sizeFileHeader + zipfile.sizeCentralDir + 2 * (name_length + extra_length)
+            + len(info.comment) + info.compress_size)
+
+def optimize_report(path, output_path, pool=None, dpi=None, drop_unused=False, dry_run=False):
+    """Deduplicate (and, with a pool, re-encode PNGs of) one report"""
+    items, relationships = inventory_media(path)
+    changed_rels, dropped = plan_deduplication(items, relationships, drop_unused)
+    dropped_set = set(dropped)
+
+    replacements = {}
+    recompressed = []
+    with zipfile.ZipFile(path) as archive:
+        for rels_name in changed_rels:
+            replacements[rels_name] = etree.tostring(relationships[rels_name], xml_declaration=True,
+                                                     encoding='UTF-8', standalone=True)
+        content_types = _content_types_without(archive, dropped_set)
+        if content_types is not None:
+            replacements[CONTENT_TYPES_NAME] = content_types
+        for name in dropped:
+            replacements[name] = None
+        dropped_bytes = sum(_member_footprint(archive.getinfo(name)) for name in dropped)
+
+        if pool is not None:
+            futures = []
+            for item in items.values():
+                if item.name in dropped_set:
+                    continue
+                data = archive.read(item.name)
+                if not data.startswith(PNG_SIGNATURE):
+                    continue
+                max_width = math.ceil(item.extent[0] / EMU_PER_INCH * dpi) if dpi and item.extent else None
+                futures.append(pool.submit(_recompress_png, item.name, data, max_width, dpi))
+            for future in as_completed(futures):
+                name, data = future.result()
+                if data is not None:
+                    replacements[name] = data
+                    recompressed.append((name, items[name].size - len(data)))
+
+    deduplicated = [(item.name, item.duplicate_of, item.compressed_size)
+                    for item in items.values() if item.duplicate_of]
+    input_size = os.path.getsize(path)
+    if dry_run:
+        # Estimated from what would be left out or re-encoded; the rewritten
+        # rels and content types differ by a few bytes at most
+        output_size = input_size - dropped_bytes - sum(saved for _, saved in recompressed)
+    elif not replacements:
+        output_size = input_size
+        if os.path.abspath(output_path) != os.path.abspath(path):
+            shutil.copyfile(path, output_path)
+    else:
+        repackage_docx(path, output_path, replacements)
+        output_size = os.path.getsize(output_path)
+    return OptimizeResult(input_size, output_size, deduplicated,
+                          [name for name in dropped if not items[name].duplicate_of], sorted(recompressed))
+
+def format_bytes(count):
+    for unit in ('B', 'KB', 'MB'):
+        if abs(count) < 1024 or unit == 'MB':
+            return f"{count:.0f} {unit}" if unit == 'B' else f"{count:.1f} {unit}"
+        count /= 1024
+
+def run_inventory(args):
+    for path in args.reports:
+        items, _ = inventory_media(path)
+        print("=" * 96)
+        print(path)
+        print("-" * 96)
+        print(f"{'Member':<28} {'Bytes':>9} {'Pixels':>11} {'Shown (in)':>11} {'DPI':>6} {'Uses':>5}  Duplicate of")
+        duplicate_bytes = 0
+        for item in items.values():
+            pixels = f"{item.pixels[0]}x{item.pixels[1]}" if item.pixels else '?'
+            shown = (f"{item.extent[0] / EMU_PER_INCH:.1f}x{item.extent[1] / EMU_PER_INCH:.1f}"
+                     if item.extent else '-')
+            dpi = f"{item.dpi:.0f}" if item.dpi else '-'
+            print(f"{item.name:<28} {item.size:>9} {pixels:>11} {shown:>11} {dpi:>6} "
+                  f"{len(item.usages):>5}  {item.duplicate_of or ''}")
+            if item.duplicate_of:
+                duplicate_bytes += item.compressed_size
+        print("-" * 96)
+        unused = sum(1 for item in items.values() if not item.usages)
+        print(f"{len(items)} media part(s), {sum(1 for item in items.values() if item.duplicate_of)} duplicate(s) "
+              f"({format_bytes(duplicate_bytes)}), {unused} unused")
+    return 0
+
+def run_optimize(args):
+    recompress = args.dpi is not None or args.reencode
+    if recompress:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            print("PNG re-encoding needs Pillow; deduplicating only", file=sys.stderr)
+            recompress = False
+    outputs = {}
+    if args.in_place:
+        outputs = {path: path for path in args.reports}
+    else:
+        os.makedirs(args.output_dir, exist_ok=True)
+        for path in args.reports:
+            output = os.path.join(args.output_dir, os.path.basename(path))
+            if os.path.abspath(output) == os.path.abspath(path):
+                print(f"Refusing to overwrite input without --in-place: {path}", file=sys.stderr)
+                return 1
+            if output in outputs.values():
+                print(f"Two reports would both be written to {output}", file=sys.stderr)
+                return 1
+            outputs[path] = output
+
+    start = time.perf_counter()
+    total_saved = 0
+    pool = ProcessPoolExecutor(max_workers=args.jobs) if recompress else None
+    try:
+        for path in args.reports:
+            result = optimize_report(path, outputs[path], pool, args.dpi, args.drop_unused, args.dry_run)
+            for name, canonical, size in result.deduplicated:
+                print(f"  dedup      {name} -> {canonical} ({format_bytes(size)})")
+            for name in result.dropped:
+                print(f"  unused     {name}")
+            for name, saved in result.recompressed:
+                print(f"  re-encoded {name} (-{format_bytes(saved)})")
+            saved = result.input_size - result.output_size
+            total_saved += saved
+            print(f"{path}: {format_bytes(result.input_size)} -> "
+                  f"{format_bytes(result.input_size - saved)} (saved {format_bytes(saved)})")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    label = 'would save' if args.dry_run else 'saved'
+    print(f"{len(args.reports)} report(s), {label} {format_bytes(total_saved)} "
+          f"in {time.perf_counter() - start:.2f}s")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='media_docx',
+                                     description='Inventory and shrink the images embedded in .docx reports.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    inventory = commands.add_parser('inventory', help='list media parts with their hashes, sizes and uses')
+    inventory.add_argument('reports', nargs='+', help='.docx reports to inspect')
+    inventory.set_defaults(handler=run_inventory)
+
+    optimize = commands.add_parser('optimize', help='deduplicate and optionally re-encode images')
+    optimize.add_argument('reports', nargs='+', help='.docx reports to optimize')
+    target = optimize.add_mutually_exclusive_group(required=True)
+    target.add_argument('-o', '--output-dir', help='directory for the optimized reports')
+    target.add_argument('--in-place', action='store_true', help='overwrite the reports')
+    optimize.add_argument('--dpi', type=int,
+                          help='downscale PNGs wider than this DPI at their displayed size (needs Pillow)')
+    optimize.add_argument('--reencode', action='store_true',
+                          help='re-encode PNGs with maximum compression (needs Pillow)')
+    optimize.add_argument('--drop-unused', action='store_true', help='remove media no relationship uses')
+    optimize.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                          help='worker processes for re-encoding (default: CPU count)')
+    optimize.add_argument('--dry-run', action='store_true',
+                          help='report what would change and estimate the savings without writing '
+                               '(re-encoding still runs, in memory)')
+    optimize.set_defaults(handler=run_optimize)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
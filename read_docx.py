@@ -1,19 +1,953 @@
-from docx import Document
-
-# Read the Word document
-doc = Document(r"C:\Users\rohan\OneDrive\Documents\IVARS\IVARS-REPORT.docx")
-
-print("=" * 80)
-print("DOCUMENT STRUCTURE")
-print("=" * 80)
-
-for i, para in enumerate(doc.paragraphs):
-    if para.text.strip():
-        style = para.style.name
-        text = para.text.strip()
-        print(f"\n[Para {i}] Style: {style}")
-        print(f"Text: {text[:100]}...")
-        
-print("\n" + "=" * 80)
-print("Total paragraphs:", len(doc.paragraphs))
-print("=" * 80)
+import argparse
+import csv
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from lxml import etree
+
+from docx_package import REL_TYPE_STYLES, DocxPackage, main_document_name, related_member, write_atomic
+from report_mapping import load_mapping
+from text_match import HeadingMatcher
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+W_BODY = f'{{{W_NS}}}body'
+W_P = f'{{{W_NS}}}p'
+W_R = f'{{{W_NS}}}r'
+W_T = f'{{{W_NS}}}t'
+W_TAB = f'{{{W_NS}}}tab'
+W_BR = f'{{{W_NS}}}br'
+W_CR = f'{{{W_NS}}}cr'
+W_PTAB = f'{{{W_NS}}}ptab'
+W_NO_BREAK_HYPHEN = f'{{{W_NS}}}noBreakHyphen'
+W_HYPERLINK = f'{{{W_NS}}}hyperlink'
+W_TYPE = f'{{{W_NS}}}type'
+W_TBL = f'{{{W_NS}}}tbl'
+W_SDT = f'{{{W_NS}}}sdt'
+W_TR = f'{{{W_NS}}}tr'
+W_TC = f'{{{W_NS}}}tc'
+W_GRID_COL_PATH = f'{{{W_NS}}}tblGrid/{{{W_NS}}}gridCol'
+W_GRID_SPAN_PATH = f'{{{W_NS}}}tcPr/{{{W_NS}}}gridSpan'
+W_VMERGE_PATH = f'{{{W_NS}}}tcPr/{{{W_NS}}}vMerge'
+W_GRID_BEFORE_PATH = f'{{{W_NS}}}trPr/{{{W_NS}}}gridBefore'
+W_VAL = f'{{{W_NS}}}val'
+W_PSTYLE_PATH = f'{{{W_NS}}}pPr/{{{W_NS}}}pStyle'
+W_OUTLINE_PATH = f'{{{W_NS}}}pPr/{{{W_NS}}}outlineLvl'
+
+A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+A_BLIP = f'{{{A_NS}}}blip'
+R_EMBED = f'{{{R_NS}}}embed'
+
+# Built-in style names Word stores in lowercase, as python-docx shows them
+UI_STYLE_NAMES = {
+    'caption': 'Caption',
+    'footer': 'Footer',
+    'header': 'Header',
+    **{f'heading {level}': f'Heading {level}' for level in range(1, 10)},
+}
+HEADING_NAME = re.compile(r'Heading ([1-9])')
+# The heading styles whose sections update_docx.py rewrites
+HEADING_STYLES = ('Heading 1', 'Heading 2', 'Heading 3', 'Heading 4')
+PREVIEW_LENGTH = 100
+
+@dataclass(slots=True)
+class StyleMap:
+    """Paragraph style names and heading levels, keyed by style ID"""
+    names: dict
+    levels: dict
+    default: str
+
+    def name(self, style_id):
+        return self.names.get(style_id or self.default, self.names.get(self.default, 'Normal'))
+
+    def level(self, style_id):
+        return self.levels.get(style_id or self.default)
+
+def read_styles(archive, document_name):
+    """Build the style map once from the package's styles part"""
+    names, levels, default = {}, {}, None
+    styles_name = related_member(archive, document_name, REL_TYPE_STYLES)
+    if styles_name is not None:
+        for style in etree.fromstring(archive.read(styles_name)).iter(f'{{{W_NS}}}style'):
+            style_id = style.get(f'{{{W_NS}}}styleId')
+            name = style.find(f'{{{W_NS}}}name')
+            name = style_id if name is None else name.get(W_VAL)
+            name = UI_STYLE_NAMES.get(name, name)
+            names[style_id] = name
+            if style.get(f'{{{W_NS}}}type') != 'paragraph':
+                continue
+            if style.get(f'{{{W_NS}}}default') in ('1', 'true'):
+                default = style_id
+            outline = style.find(W_OUTLINE_PATH)
+            heading = HEADING_NAME.fullmatch(name)
+            if outline is not None and int(outline.get(W_VAL)) < 9:
+                levels[style_id] = int(outline.get(W_VAL)) + 1
+            elif heading:
+                levels[style_id] = int(heading.group(1))
+    return StyleMap(names, levels, default)
+
+def paragraph_style_id(paragraph):
+    style = paragraph.find(W_PSTYLE_PATH)
+    return None if style is None else style.get(W_VAL)
+
+def iter_runs(paragraph):
+    """The paragraph's own runs, directly or inside hyperlinks.
+
+    Runs nested in text boxes or drawings are not part of its text.
+    """
+    for child in paragraph:
+        if child.tag == W_R:
+            yield child
+        elif child.tag == W_HYPERLINK:
+            yield from child.iterchildren(W_R)
+
+def run_item_text(item):
+    """Text a single run child contributes to the paragraph text"""
+    tag = item.tag
+    if tag == W_T:
+        return item.text or ''
+    if tag in (W_TAB, W_PTAB):
+        return '\t'
+    if tag == W_CR or (tag == W_BR and item.get(W_TYPE, 'textWrapping') == 'textWrapping'):
+        return '\n'
+    if tag == W_NO_BREAK_HYPHEN:
+        return '-'
+    return ''
+
+def run_text(run):
+    return ''.join(run_item_text(item) for item in run)
+
+def paragraph_text(paragraph):
+    """Text of a raw w:p element, matching python-docx's Paragraph.text"""
+    return ''.join(run_text(run) for run in iter_runs(paragraph))
+
+def iter_body_blocks(source):
+    """Yield the top-level body elements of document XML one at a time.
+
+    Each element is cleared and detached once the caller moves on, so
+    memory stays flat however long the document is.
+    """
+    for _, element in etree.iterparse(source, events=('end',), tag=(W_P, W_TBL, W_SDT)):
+        parent = element.getparent()
+        if parent is None or parent.tag != W_BODY:
+            continue
+        yield element
+        element.clear()
+        parent.remove(element)
+
+@dataclass(slots=True)
+class ParagraphRecord:
+    index: int
+    style: str
+    level: int
+    length: int
+    preview: str
+
+    def as_dict(self):
+        return {'index': self.index, 'style': self.style, 'level': self.level,
+                'length': self.length, 'preview': self.preview}
+
+def iter_paragraph_records(path, include_empty=False):
+    """Yield one record per body-level paragraph, numbered like doc.paragraphs"""
+    with DocxPackage(path) as archive:
+        document_name = main_document_name(archive)
+        styles = read_styles(archive, document_name)
+        with archive.open(document_name) as source:
+            index = 0
+            for block in iter_body_blocks(source):
+                if block.tag != W_P:
+                    continue
+                text = paragraph_text(block).strip()
+                if text or include_empty:
+                    style_id = paragraph_style_id(block)
+                    yield ParagraphRecord(index, styles.name(style_id), styles.level(style_id),
+                                          len(text), text[:PREVIEW_LENGTH])
+                index += 1
+
+def iter_heading_paragraphs(path):
+    """Yield (index, style, text, heading path) for each non-empty body paragraph.
+
+    Indexes are numbered like doc.paragraphs, empty paragraphs included,
+    and the heading path ends with the paragraph itself for headings.
+    """
+    path_stack = []
+    with DocxPackage(path) as archive:
+        document_name = main_document_name(archive)
+        styles = read_styles(archive, document_name)
+        with archive.open(document_name) as source:
+            index = 0
+            for block in iter_body_blocks(source):
+                if block.tag != W_P:
+                    continue
+                text = paragraph_text(block).strip()
+                if text:
+                    style_id = paragraph_style_id(block)
+                    level = styles.level(style_id)
+                    if level:
+                        while path_stack and path_stack[-1][0] >= level:
+                            path_stack.pop()
+                        path_stack.append((level, text))
+                    yield index, styles.name(style_id), text, tuple(heading for _, heading in path_stack)
+                index += 1
+
+OUTLINE_CACHE_VERSION = 1
+HASH_CHUNK_SIZE = 1 << 20
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def block_signature(block, styles):
+    """Style and text of a body block, the unit section hashes are built from"""
+    if block.tag == W_P:
+        return f"{styles.name(paragraph_style_id(block))}\0{paragraph_text(block)}"
+    return f"{etree.QName(block).localname}\0" + '\n'.join(paragraph_text(p) for p in block.iter(W_P))
+
+def build_outline(path):
+    """Index a report's heading tree, paragraph positions, style usage and sections.
+
+    Sections start at every heading (plus a preamble before the first one)
+    and carry a hash of their blocks' styles and text.
+    """
+    stat = os.stat(path)
+    tree = {'children': []}
+    stack = [(0, tree)]
+    histogram = Counter()
+    offsets = []
+    sections = []
+    section = {'index': None, 'level': 0, 'text': '', 'start': 0, 'blocks': 0}
+    digest = hashlib.sha256()
+
+    def close_section():
+        section['hash'] = digest.hexdigest()
+        sections.append(section)
+
+    with DocxPackage(path) as archive:
+        document_name = main_document_name(archive)
+        styles = read_styles(archive, document_name)
+        with archive.open(document_name) as source:
+            position = -1
+            for position, block in enumerate(iter_body_blocks(source)):
+                if block.tag == W_P:
+                    style_id = paragraph_style_id(block)
+                    histogram[styles.name(style_id)] += 1
+                    index = len(offsets)
+                    offsets.append(position)
+                    level = styles.level(style_id)
+                    text = paragraph_text(block).strip()
+                    if level and text:
+                        close_section()
+                        section = {'index': index, 'level': level, 'text': text,
+                                   'start': position, 'blocks': 0}
+                        digest = hashlib.sha256()
+                        while stack[-1][0] >= level:
+                            stack.pop()
+                        node = {'index': index, 'level': level, 'text': text, 'children': []}
+                        stack[-1][1]['children'].append(node)
+                        stack.append((level, node))
+                digest.update(block_signature(block, styles).encode('utf-8'))
+                digest.update(b'\n')
+                section['blocks'] += 1
+    close_section()
+
+    return {
+        'version': OUTLINE_CACHE_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': file_sha256(path),
+        'paragraphs': len(offsets),
+        'blocks': position + 1,
+        'offsets': offsets,
+        'styles': dict(histogram.most_common()),
+        'headings': tree['children'],
+        'sections': sections,
+    }
+
+def outline_cache_path(path):
+    """Sidecar cache file kept next to the report"""
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, f'.{name}.outline.json')
+
+def _read_cached_outline(path):
+    try:
+        with open(outline_cache_path(path), encoding='utf-8') as f:
+            outline = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return outline if outline.get('version') == OUTLINE_CACHE_VERSION else None
+
+def _write_cached_outline(path, outline):
+    cache_path = outline_cache_path(path)
+    try:
+        write_atomic(cache_path, json.dumps(outline, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    except OSError as exc:
+        print(f"Could not write outline cache {cache_path}: {exc}", file=sys.stderr)
+
+def load_outline(path, use_cache=True):
+    """Return (outline, from_cache) for a report.
+
+    A cached outline is reused when the file's size and mtime match. When
+    only the mtime moved, the content hash decides, and a matching hash
+    refreshes the stored mtime. Anything else re-indexes the file.
+    """
+    if use_cache:
+        cached = _read_cached_outline(path)
+        if cached is not None:
+            stat = os.stat(path)
+            if cached['size'] == stat.st_size:
+                if cached['mtime_ns'] == stat.st_mtime_ns:
+                    return cached, True
+                if cached['sha256'] == file_sha256(path):
+                    cached['mtime_ns'] = stat.st_mtime_ns
+                    _write_cached_outline(path, cached)
+                    return cached, True
+
+    outline = build_outline(path)
+    if use_cache:
+        _write_cached_outline(path, outline)
+    return outline, False
+
+def print_outline(outline, out=sys.stdout):
+    """Print the heading tree and style histogram of an outline"""
+    def walk(nodes, depth):
+        for node in nodes:
+            print(f"{'  ' * depth}[{node['index']}] {node['text'][:PREVIEW_LENGTH]}", file=out)
+            walk(node['children'], depth + 1)
+
+    print("=" * 80, file=out)
+    print("OUTLINE", file=out)
+    print("=" * 80, file=out)
+    walk(outline['headings'], 0)
+    print("\n" + "-" * 80, file=out)
+    print("Style usage:", file=out)
+    for name, count in outline['styles'].items():
+        print(f"  {name:<40} {count:>6}", file=out)
+    print("-" * 80, file=out)
+    print(f"Paragraphs: {outline['paragraphs']}  Blocks: {outline['blocks']}  "
+          f"Sections: {len(outline['sections'])}", file=out)
+    print("=" * 80, file=out)
+
+def dump_structure(path, output_format='text', include_empty=False, out=sys.stdout):
+    """Write the paragraph structure of a report in the chosen format"""
+    if output_format == 'ndjson':
+        for record in iter_paragraph_records(path, include_empty):
+            out.write(json.dumps(record.as_dict(), ensure_ascii=False) + '\n')
+        return
+    if output_format == 'json':
+        out.write('[')
+        for position, record in enumerate(iter_paragraph_records(path, include_empty)):
+            out.write((',\n' if position else '\n') + json.dumps(record.as_dict(), ensure_ascii=False))
+        out.write('\n]\n')
+        return
+
+    print("=" * 80, file=out)
+    print("DOCUMENT STRUCTURE", file=out)
+    print("=" * 80, file=out)
+    total = 0
+    for record in iter_paragraph_records(path, include_empty=True):
+        total += 1
+        if record.length or include_empty:
+            print(f"\n[Para {record.index}] Style: {record.style}", file=out)
+            print(f"Text: {record.preview}...", file=out)
+    print("\n" + "=" * 80, file=out)
+    print("Total paragraphs:", total, file=out)
+    print("=" * 80, file=out)
+
+def find_reports(patterns):
+    """Expand directories and glob patterns into a sorted list of .docx files"""
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            for directory, _, names in os.walk(pattern):
+                paths.update(os.path.join(directory, name) for name in names
+                             if name.lower().endswith('.docx') and not name.startswith('~$'))
+        else:
+            paths.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(paths)
+
+def iter_headings(nodes):
+    for node in nodes:
+        yield node
+        yield from iter_headings(node['children'])
+
+def _inspect_job(path, use_cache):
+    """Summarize one report for the corpus table"""
+    start = time.perf_counter()
+    try:
+        outline, from_cache = load_outline(path, use_cache)
+    except Exception as exc:
+        return {'path': path, 'error': f"{type(exc).__name__}: {exc}",
+                'seconds': time.perf_counter() - start}
+    return {
+        'path': path,
+        'error': None,
+        'paragraphs': outline['paragraphs'],
+        'styles': outline['styles'],
+        'headings': [(node['level'], node['text']) for node in iter_headings(outline['headings'])],
+        'cached': from_cache,
+        'seconds': time.perf_counter() - start,
+    }
+
+def inspect_corpus(paths, jobs=None, use_cache=True, progress=None):
+    """Inspect reports in a process pool, returning summaries in path order"""
+    jobs = jobs or os.cpu_count() or 1
+    results = [None] * len(paths)
+    if jobs <= 1 or len(paths) <= 1:
+        completed = ((position, _inspect_job(path, use_cache)) for position, path in enumerate(paths))
+        for done, (position, result) in enumerate(completed, start=1):
+            results[position] = result
+            if progress:
+                progress(done, len(paths), result)
+        return results
+    with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+        futures = {pool.submit(_inspect_job, path, use_cache): position
+                   for position, path in enumerate(paths)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            result = future.result()
+            results[futures[future]] = result
+            if progress:
+                progress(done, len(paths), result)
+    return results
+
+def heading_coverage(results, mapping):
+    """Count, per content_mapping key, the reports with a heading resolving to it.
+
+    Headings are matched the way update_docx.py does it, so only heading
+    levels it rewrites are considered.
+    """
+    max_level = len(HEADING_STYLES)
+    matcher = HeadingMatcher(mapping)
+    coverage = dict.fromkeys(matcher.keys, 0)
+    per_file = []
+    for result in results:
+        if result['error']:
+            per_file.append(set())
+            continue
+        keys = {matcher.match(text) for level, text in result['headings'] if level <= max_level}
+        keys.discard(None)
+        for key in keys:
+            coverage[key] += 1
+        per_file.append(keys)
+    return coverage, per_file
+
+def run_corpus(args):
+    paths = find_reports(args.paths)
+    if not paths:
+        print("No .docx files found")
+        return 1
+
+    def progress(done, total, result):
+        status = result['error'] or ('cached' if result.get('cached') else 'indexed')
+        print(f"[{done}/{total}] {result['path']} ({result['seconds']:.2f}s, {status})", file=sys.stderr)
+
+    start = time.perf_counter()
+    results = inspect_corpus(paths, args.jobs, not args.no_cache, progress)
+    elapsed = time.perf_counter() - start
+    mapping = load_mapping(args.mapping)
+    coverage, per_file = heading_coverage(results, mapping)
+
+    styles = Counter()
+    for result in results:
+        if not result['error']:
+            styles.update(result['styles'])
+    failures = [result for result in results if result['error']]
+
+    print("=" * 80)
+    print(f"{'File':<44} {'Paras':>7} {'Heads':>6} {'Keys':>5} {'Seconds':>8}")
+    print("-" * 80)
+    for result, keys in zip(results, per_file):
+        name = os.path.relpath(result['path'])[-44:]
+        if result['error']:
+            print(f"{name:<44} {result['error']}")
+            continue
+        print(f"{name:<44} {result['paragraphs']:>7} {len(result['headings']):>6} "
+              f"{len(keys):>5} {result['seconds']:>8.2f}")
+    print("-" * 80)
+    print("Heading coverage (reports with a heading for each mapping key):")
+    for key, count in coverage.items():
+        print(f"  {key:<44} {count:>4}/{len(results)}")
+    print("-" * 80)
+    print("Style usage:")
+    for name, count in styles.most_common(args.top_styles):
+        print(f"  {name:<44} {count:>8}")
+    print("-" * 80)
+    paragraphs = sum(result['paragraphs'] for result in results if not result['error'])
+    print(f"{len(results)} file(s), {len(failures)} failed, {paragraphs} paragraphs "
+          f"in {elapsed:.2f}s ({len(results) / elapsed:.1f} files/s)")
+    print("=" * 80)
+    return 1 if failures else 0
+
+@dataclass(slots=True)
+class TableRecord:
+    index: int
+    caption: str
+    rows: list
+
+    @property
+    def columns(self):
+        return max((len(row) for row in self.rows), default=0)
+
+def _grid_value(element, path, default=0):
+    found = element.find(path)
+    return default if found is None else int(found.get(W_VAL, default))
+
+def table_rows(table, fill_merged=True):
+    """Cell text of a w:tbl laid out on its grid.
+
+    Horizontally spanned cells and vertical-merge continuations repeat
+    the merged cell's text, like python-docx's row.cells, unless
+    fill_merged is off, in which case they are left empty.
+    """
+    rows = []
+    for row in table.iterchildren(W_TR):
+        cells = [''] * _grid_value(row, W_GRID_BEFORE_PATH)
+        for cell in row.iterchildren(W_TC):
+            column = len(cells)
+            span = _grid_value(cell, W_GRID_SPAN_PATH, 1)
+            merge = cell.find(W_VMERGE_PATH)
+            if merge is not None and merge.get(W_VAL, 'continue') == 'continue':
+                above = rows[-1] if rows else ()
+                text = above[column] if fill_merged and column < len(above) else ''
+            else:
+                text = '\n'.join(paragraph_text(p) for p in cell.iterchildren(W_P))
+            cells.append(text)
+            cells.extend([text if fill_merged else ''] * (span - 1))
+        rows.append(cells)
+    width = max(len(table.findall(W_GRID_COL_PATH)), *(len(cells) for cells in rows), 0)
+    for cells in rows:
+        cells.extend([''] * (width - len(cells)))
+    return rows
+
+TABLE_CAPTION = re.compile(r'table\s+[A-Z]?\d', re.IGNORECASE)
+
+def iter_tables(path, fill_merged=True):
+    """Yield every body-level table of a report in one streaming pass.
+
+    The caption is the first non-empty paragraph after the table when it
+    starts with "Table N" or is Caption-styled, as reports usually place
+    it; otherwise the last non-empty paragraph before the table.
+    """
+    with DocxPackage(path) as archive:
+        document_name = main_document_name(archive)
+        style_names = None
+
+        def is_caption(paragraph, text):
+            nonlocal style_names
+            if TABLE_CAPTION.match(text):
+                return True
+            if style_names is None:
+                # Only read styles.xml for a table not followed by "Table N"
+                style_names = read_styles(archive, document_name).names
+            style_id = paragraph_style_id(paragraph)
+            return 'caption' in style_names.get(style_id, style_id or '').lower()
+
+        with archive.open(document_name) as source:
+            preceding = ''
+            pending = None  # (rows, preceding text) of a table awaiting its next paragraph
+            index = 0
+            for block in iter_body_blocks(source):
+                if block.tag == W_P:
+                    text = paragraph_text(block).strip()
+                    if not text:
+                        continue
+                    if pending is not None:
+                        rows, before = pending
+                        pending = None
+                        caption = is_caption(block, text)
+                        yield TableRecord(index, text if caption else before, rows)
+                        index += 1
+                        if caption:
+                            preceding = ''
+                            continue
+                    preceding = text
+                elif block.tag == W_TBL:
+                    if pending is not None:
+                        rows, before = pending
+                        yield TableRecord(index, before, rows)
+                        index += 1
+                    pending = (table_rows(block, fill_merged), preceding)
+                    preceding = ''
+            if pending is not None:
+                rows, before = pending
+                yield TableRecord(index, before, rows)
+
+def write_table_csv(table, path):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        csv.writer(f).writerows(table.rows)
+
+def write_table_arrow(table, path, header=False):
+    """Write a table as an Arrow IPC file of string columns (needs pyarrow)"""
+    import pyarrow as pa
+
+    rows = table.rows[1:] if header and table.rows else table.rows
+    names = table.rows[0] if header and table.rows else [f'column_{n}' for n in range(table.columns)]
+    names = [name or f'column_{n}' for n, name in enumerate(names)]
+    arrays = [pa.array([row[n] for row in rows], type=pa.string()) for n in range(len(names))]
+    batch = pa.record_batch(arrays, names=names)
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+
+SEARCH_INDEX_VERSION = 2
+# The manifest; each report's postings and paragraph text live in the
+# directory of the same name without the extension
+SEARCH_INDEX_PATH = '.report-index.json'
+TOKEN = re.compile(r'\w+%?')
+
+def tokenize(text):
+    return TOKEN.findall(text.lower())
+
+def index_report(path, stat=None, sha256=None):
+    """Per-file index entry: paragraphs, heading paths and positional postings"""
+    stat = stat or os.stat(path)
+    headings = {}
+    paragraphs = []
+    postings = {}
+    for index, style, text, heading in iter_heading_paragraphs(path):
+        slot = len(paragraphs)
+        paragraphs.append([index, headings.setdefault(heading, len(headings)), style, text])
+        for position, term in enumerate(tokenize(text)):
+            entry = postings.setdefault(term, {})
+            entry.setdefault(slot, []).append(position)
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': sha256 or file_sha256(path),
+        'headings': [list(heading) for heading in headings],
+        'paragraphs': paragraphs,
+        # Sorted terms let prefix queries bisect the key list
+        'postings': {term: [[slot, *positions] for slot, positions in postings[term].items()]
+                     for term in sorted(postings)},
+    }
+
+def search_index_dir(index_path):
+    return os.path.splitext(index_path)[0]
+
+def _report_key(path):
+    return hashlib.sha256(path.encode('utf-8')).hexdigest()[:16]
+
+def load_search_index(index_path):
+    """The manifest: per-report size, mtime and hash, without postings or text"""
+    try:
+        with open(index_path, encoding='utf-8') as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return {'version': SEARCH_INDEX_VERSION, 'files': {}}
+    except ValueError as exc:
+        raise ValueError(f"Corrupt search index {index_path}: {exc}") from exc
+    if index.get('version') != SEARCH_INDEX_VERSION:
+        return {'version': SEARCH_INDEX_VERSION, 'files': {}}
+    # Reports whose parts have gone missing are re-indexed
+    directory = search_index_dir(index_path)
+    index['files'] = {path: entry for path, entry in index['files'].items()
+                      if os.path.exists(os.path.join(directory, f"{entry['key']}.terms.json"))}
+    return index
+
+def _json_lines(items):
+    """Encode items one per line; returns (data, byte offsets with the end appended)"""
+    lines = [json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+             for item in items]
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    return b''.join(lines), offsets
+
+def save_search_index(index_path, index):
+    """Write reports indexed since loading and the manifest.
+
+    Each report is split in three parts: <key>.postings.jsonl and
+    <key>.text.jsonl hold one term's postings or one paragraph per line,
+    and <key>.terms.json the sorted terms, headings and the byte offset of
+    every line. A query parses only the terms, then seeks to the postings
+    of its tokens and the paragraphs they match. Parts of reports no
+    longer in the manifest are removed.
+    """
+    directory = search_index_dir(index_path)
+    os.makedirs(directory, exist_ok=True)
+    files = index['files']
+    for path, entry in files.items():
+        entry['key'] = _report_key(path)
+        if 'postings' not in entry:
+            continue
+        base = os.path.join(directory, entry['key'])
+        postings = entry.pop('postings')
+        postings_data, postings_offsets = _json_lines(postings.values())
+        text_data, text_offsets = _json_lines(entry.pop('paragraphs'))
+        write_atomic(f"{base}.postings.jsonl", postings_data)
+        write_atomic(f"{base}.text.jsonl", text_data)
+        terms = {'terms': list(postings), 'postings': postings_offsets,
+                 'headings': entry.pop('headings'), 'paragraphs': text_offsets}
+        write_atomic(f"{base}.terms.json", json.dumps(terms, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+    keys = {entry['key'] for entry in files.values()}
+    for name in os.listdir(directory):
+        if name.split('.', 1)[0] not in keys:
+            os.remove(os.path.join(directory, name))
+    write_atomic(index_path, json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+class _StoredPostings:
+    """Read-only term -> postings mapping over a report's .postings.jsonl"""
+
+    def __init__(self, terms, offsets, f):
+        self.terms = terms
+        self._offsets = offsets
+        self._file = f
+
+    def _position(self, term):
+        n = bisect_left(self.terms, term)
+        return n if n < len(self.terms) and self.terms[n] == term else None
+
+    def __contains__(self, term):
+        return self._position(term) is not None
+
+    def __getitem__(self, term):
+        n = self._position(term)
+        if n is None:
+            raise KeyError(term)
+        self._file.seek(self._offsets[n])
+        return json.loads(self._file.read(self._offsets[n + 1] - self._offsets[n]))
+
+def update_search_index(index, paths):
+    """Re-index new or changed reports and drop entries for deleted files.
+
+    Returns (indexed, unchanged, refreshed, removed) lists of paths.
+    Change detection follows load_outline: size and mtime first, then the
+    content hash. Unchanged reports whose mtime moved are also listed in
+    refreshed, as their manifest entry now holds the new mtime.
+    """
+    files = index['files']
+    indexed, unchanged, refreshed = [], [], []
+    for path in paths:
+        key = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = files.get(key)
+        if entry and entry['size'] == stat.st_size:
+            if entry['mtime_ns'] == stat.st_mtime_ns:
+                unchanged.append(key)
+                continue
+            sha256 = file_sha256(path)
+            if entry['sha256'] == sha256:
+                entry['mtime_ns'] = stat.st_mtime_ns
+                unchanged.append(key)
+                refreshed.append(key)
+                continue
+        else:
+            sha256 = None
+        files[key] = index_report(path, stat, sha256)
+        indexed.append(key)
+    removed = [key for key in files if not os.path.exists(key)]
+    for key in removed:
+        del files[key]
+    return indexed, unchanged, refreshed, removed
+
+def _term_positions(postings, terms, token, prefix):
+    """Map paragraph slot to the positions of a token (or any term it prefixes)"""
+    if not prefix:
+        matched = [token] if token in postings else []
+    else:
+        matched = []
+        for term in terms[bisect_left(terms, token):]:
+            if not term.startswith(token):
+                break
+            matched.append(term)
+    positions = {}
+    for term in matched:
+        for slot, *term_positions in postings[term]:
+            positions.setdefault(slot, set()).update(term_positions)
+    return positions
+
+def _phrase_slots(postings, terms, query):
+    """Paragraph slots containing the query's tokens consecutively.
+
+    A trailing '*' turns the last token into a prefix.
+    """
+    prefix = query.endswith('*')
+    tokens = tokenize(query)
+    if not tokens:
+        return set()
+    per_token = [_term_positions(postings, terms, token, prefix and n == len(tokens) - 1)
+                 for n, token in enumerate(tokens)]
+    slots = set(per_token[0])
+    for positions in per_token[1:]:
+        slots &= positions.keys()
+    return {slot for slot in slots
+            if any(all(start + offset in per_token[offset][slot] for offset in range(1, len(tokens)))
+                   for start in per_token[0][slot])}
+
+def search_index(index_path, index, queries):
+    """Yield (path, paragraph index, heading path, text) for paragraphs matching every query"""
+    directory = search_index_dir(index_path)
+    for path in sorted(index['files']):
+        base = os.path.join(directory, index['files'][path]['key'])
+        with open(f"{base}.terms.json", encoding='utf-8') as f:
+            entry = json.load(f)
+        terms = entry['terms']
+        with open(f"{base}.postings.jsonl", 'rb') as f:
+            postings = _StoredPostings(terms, entry['postings'], f)
+            slots = None
+            for query in queries:
+                matched = _phrase_slots(postings, terms, query)
+                slots = matched if slots is None else slots & matched
+                if not slots:
+                    break
+        if not slots:
+            continue
+        offsets = entry['paragraphs']
+        with open(f"{base}.text.jsonl", 'rb') as f:
+            for slot in sorted(slots):
+                f.seek(offsets[slot])
+                index_number, heading_id, _, text = json.loads(f.read(offsets[slot + 1] - offsets[slot]))
+                yield path, index_number, entry['headings'][heading_id], text
+
+def run_index(args):
+    start = time.perf_counter()
+    paths = find_reports(args.paths)
+    index = load_search_index(args.index)
+    indexed, unchanged, refreshed, removed = update_search_index(index, paths)
+    # A refreshed mtime is saved too, or every run would hash those reports again
+    if indexed or refreshed or removed or not os.path.exists(args.index):
+        save_search_index(args.index, index)
+    elapsed = time.perf_counter() - start
+    for path in indexed:
+        print(f"indexed   {os.path.relpath(path)}")
+    for path in removed:
+        print(f"removed   {os.path.relpath(path)}")
+    print(f"{len(indexed)} indexed, {len(unchanged)} unchanged, {len(removed)} removed "
+          f"in {elapsed * 1000:.1f} ms ({len(index['files'])} file(s) in {args.index})")
+    return 0
+
+def run_search(args):
+    start = time.perf_counter()
+    if not os.path.exists(args.index):
+        print(f"No search index at {args.index}; run the index command first", file=sys.stderr)
+        return 1
+    index = load_search_index(args.index)
+    hits = list(search_index(args.index, index, args.queries))
+    elapsed = time.perf_counter() - start
+    if args.json:
+        json.dump([{'path': path, 'paragraph': paragraph, 'heading': heading, 'text': text}
+                   for path, paragraph, heading, text in hits], sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        for path, paragraph, heading, text in hits[:args.limit]:
+            print(f"{os.path.relpath(path)}:{paragraph} [{' > '.join(heading)}]")
+            print(f"    {' '.join(text.split())[:PREVIEW_LENGTH]}")
+        if len(hits) > args.limit:
+            print(f"... {len(hits) - args.limit} more")
+    print(f"{len(hits)} match(es) in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    return 0 if hits else 1
+
+def run_tables(args):
+    if args.format == 'arrow':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("Arrow output needs pyarrow; install it or use --format csv", file=sys.stderr)
+            return 1
+    start = time.perf_counter()
+    stem = os.path.splitext(os.path.basename(args.path))[0]
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    count = 0
+    for table in iter_tables(args.path, fill_merged=not args.blank_merged):
+        count += 1
+        line = f"[{table.index}] {len(table.rows)}x{table.columns} {table.caption[:PREVIEW_LENGTH]}"
+        if not args.output_dir:
+            print(line)
+            continue
+        output = os.path.join(args.output_dir, f"{stem}-table-{table.index + 1:03d}.{args.format}")
+        if args.format == 'arrow':
+            write_table_arrow(table, output, args.header)
+        else:
+            write_table_csv(table, output)
+        print(f"{line} -> {output}")
+    print(f"{count} table(s) in {(time.perf_counter() - start) * 1000:.1f} ms", file=sys.stderr)
+    return 0
+
+def run_dump(args):
+    dump_structure(args.path, args.format, args.all)
+    return 0
+
+def run_outline(args):
+    start = time.perf_counter()
+    outline, from_cache = load_outline(args.path, use_cache=not args.no_cache)
+    elapsed = time.perf_counter() - start
+    if args.json:
+        json.dump(outline, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_outline(outline)
+        print(f"{'Loaded from cache' if from_cache else 'Indexed'} in {elapsed * 1000:.1f} ms")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='read_docx', description='Inspect the structure of .docx reports.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    dump = commands.add_parser('dump', help='list paragraphs with their styles')
+    dump.add_argument('path', help='.docx report to inspect')
+    dump.add_argument('--format', choices=('text', 'ndjson', 'json'), default='text',
+                      help='output format (default: text)')
+    dump.add_argument('--all', action='store_true', help='include empty paragraphs')
+    dump.set_defaults(handler=run_dump)
+
+    outline = commands.add_parser('outline', help='show the heading tree, using the sidecar outline cache')
+    outline.add_argument('path', help='.docx report to inspect')
+    outline.add_argument('--json', action='store_true', help='print the full outline record as JSON')
+    outline.add_argument('--no-cache', action='store_true', help='re-index without reading or writing the cache')
+    outline.set_defaults(handler=run_outline)
+
+    corpus = commands.add_parser('corpus', help='inspect many reports in parallel and summarize them')
+    corpus.add_argument('paths', nargs='+', help='directories or glob patterns of .docx reports')
+    corpus.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help='worker processes (default: CPU count)')
+    corpus.add_argument('--mapping', help='content mapping to check heading coverage against '
+                                          '(default: the built-in mapping in update_docx.py)')
+    corpus.add_argument('--top-styles', type=int, default=15, help='number of styles to list (default: 15)')
+    corpus.add_argument('--no-cache', action='store_true', help='ignore the outline caches')
+    corpus.set_defaults(handler=run_corpus)
+
+    tables = commands.add_parser('tables', help='list tables or extract them to CSV/Arrow files')
+    tables.add_argument('path', help='.docx report to read')
+    tables.add_argument('-o', '--output-dir', help='write one file per table here (default: only list them)')
+    tables.add_argument('--format', choices=('csv', 'arrow'), default='csv',
+                        help='output file format; arrow needs pyarrow (default: csv)')
+    tables.add_argument('--header', action='store_true', help='use the first row as Arrow column names')
+    tables.add_argument('--blank-merged', action='store_true',
+                        help='leave merged cell continuations empty instead of repeating the text')
+    tables.set_defaults(handler=run_tables)
+
+    index = commands.add_parser('index', help='build or incrementally update the full-text search index')
+    index.add_argument('paths', nargs='+', help='directories or glob patterns of .docx reports')
+    index.add_argument('--index', default=SEARCH_INDEX_PATH,
+                       help=f'index file (default: {SEARCH_INDEX_PATH})')
+    index.set_defaults(handler=run_index)
+
+    search = commands.add_parser('search', help='find paragraphs in the search index')
+    search.add_argument('queries', nargs='+',
+                        help='terms or quoted phrases, all of which must match; '
+                             'a trailing * makes the last word a prefix')
+    search.add_argument('--index', default=SEARCH_INDEX_PATH,
+                        help=f'index file (default: {SEARCH_INDEX_PATH})')
+    search.add_argument('--limit', type=int, default=50, help='maximum matches to print (default: 50)')
+    search.add_argument('--json', action='store_true', help='print every match as JSON')
+    search.set_defaults(handler=run_search)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
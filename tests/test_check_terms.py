@@ -0,0 +1,33 @@
+import json
+
+from docx import Document
+from docx.oxml import OxmlElement
+
+from check_terms import GLOSSARY, Glossary, main, scan_docx
+
+def hyphenated_report(path):
+    """A paragraph with a fixable variant and one spelled with a non-breaking hyphen"""
+    document = Document()
+    paragraph = document.add_paragraph('Stored in Mongo DB; sent by E')
+    paragraph.runs[0]._r.append(OxmlElement('w:noBreakHyphen'))
+    paragraph.add_run('mail.')
+    document.save(path)
+
+def test_fix_reports_only_fixed_hits(tmp_path):
+    path = str(tmp_path / 'report.docx')
+    hyphenated_report(path)
+    glossary = Glossary({**GLOSSARY, 'Email': ['E-mail']})
+    hits = scan_docx(path, glossary, fix=True)
+    assert [(hit.found, hit.fixed) for hit in hits] == [('Mongo DB', True), ('E-mail', False)]
+    assert [hit.found for hit in scan_docx(path, glossary)] == ['E-mail']
+
+def test_main_marks_unfixed_hits(tmp_path, capsys):
+    path = str(tmp_path / 'report.docx')
+    hyphenated_report(path)
+    glossary_path = tmp_path / 'glossary.json'
+    glossary_path.write_text(json.dumps({'MongoDB': ['Mongo DB'], 'Email': ['E-mail']}))
+    main([path, '--fix', '--glossary', str(glossary_path), '-j', '1'])
+    output = capsys.readouterr().out
+    assert "'Mongo DB' (fixed 'MongoDB')" in output
+    assert "'E-mail' (not fixed, use 'Email')" in output
+    assert '2 variant(s) (1 not fixed)' in output
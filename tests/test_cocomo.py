@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from cocomo import MODES, ORGANIC, OUTPUTS, PERCENTILES, evaluate, sensitivity, simulate
+
+def test_evaluate_matches_the_basic_formulas():
+    for mode in MODES:
+        result = evaluate(mode, 6.3, 4.2)
+        effort = mode.a * 6.3 ** mode.b
+        time = mode.c * effort ** mode.d
+        assert result['effort'] == pytest.approx(effort)
+        assert result['time'] == pytest.approx(time)
+        assert result['staff'] == pytest.approx(effort / time)
+        assert result['cost'] == pytest.approx(effort * 4.2)
+
+def test_evaluate_broadcasts_sizes_against_rates():
+    result = evaluate(ORGANIC, np.array([[5.0], [10.0]]), np.array([[3.6, 4.2, 5.0]]))
+    assert result['effort'].shape == (2, 1)
+    assert result['cost'].shape == (2, 3)
+    assert result['cost'][1, 2] == pytest.approx(evaluate(ORGANIC, 10.0, 5.0)['cost'])
+
+def test_sensitivity_grid_has_a_row_per_size():
+    grid = sensitivity(ORGANIC, [5.0, 6.3, 8.0, 10.0], [3.6, 4.2])
+    assert grid.shape == (4, 2)
+    assert grid[1, 1] == pytest.approx(evaluate(ORGANIC, 6.3, 4.2)['cost'])
+    assert (np.diff(grid, axis=0) > 0).all()
+    time_grid = sensitivity(ORGANIC, [5.0, 10.0], [3.6, 4.2], output='time')
+    assert (time_grid[:, 0] == time_grid[:, 1]).all()
+
+def test_seeded_simulation_is_reproducible():
+    first = simulate(6.3, samples=10_000)
+    second = simulate(6.3, samples=10_000)
+    for mode in MODES:
+        assert np.array_equal(first.percentiles[mode.name], second.percentiles[mode.name])
+    other = simulate(6.3, samples=10_000, seed=1)
+    assert not np.array_equal(first.percentiles[ORGANIC.name], other.percentiles[ORGANIC.name])
+
+def test_simulated_percentiles():
+    simulation = simulate(6.3)
+    expected = {
+        'effort': (13.55, 16.58, 20.28),
+        'time': (6.73, 7.27, 7.85),
+        'staff': (2.01, 2.28, 2.58),
+        'cost': (56.66, 70.60, 87.89),
+    }
+    for output in OUTPUTS:
+        values = [simulation.value(ORGANIC, output, percentile) for percentile in PERCENTILES]
+        assert values == pytest.approx(expected[output], abs=0.005)
+    # The median size is the measured size, so the P50 rows are the formulas
+    assert simulation.value(ORGANIC, 'effort') == pytest.approx(evaluate(ORGANIC, 6.3, 4.2)['effort'], rel=1e-3)
+
+def test_modes_rank_by_effort():
+    simulation = simulate(6.3, samples=10_000)
+    efforts = [simulation.value(mode, 'effort') for mode in MODES]
+    assert efforts == sorted(efforts)
@@ -0,0 +1,31 @@
+from count_loc import COMMENT_SYNTAX, count_lines
+
+JS = COMMENT_SYNTAX['.js']
+CSS = COMMENT_SYNTAX['.css']
+
+def counts(text, syntax=JS):
+    result = count_lines(text, syntax)
+    return result.code, result.comment, result.blank
+
+def test_code_comment_and_blank_lines():
+    assert counts('const a = 1;\n\n// note\nlet b = 2; // trailing\n') == (2, 1, 1)
+
+def test_escaped_backslash_closes_string():
+    # The quote after \\ closes the string, so the block comment opens
+    assert counts('const path = "C:\\\\";  /* start\nstill a comment */\n') == (1, 1, 0)
+
+def test_escaped_quote_keeps_string_open():
+    assert counts('const quote = "say \\"/*\\" here"; // done\n// next\n') == (1, 1, 0)
+
+def test_trailing_text_does_not_change_escape_parity():
+    for tail in ('', ' ', '   x'):
+        assert counts(f'a = "\\\\"; /* open{tail}\nclosed */\n') == (1, 1, 0)
+
+def test_comment_markers_inside_strings():
+    assert counts("const url = 'https://example.com/*';\nconst b = 1;\n") == (2, 0, 0)
+
+def test_template_literal_spans_lines():
+    assert counts('const html = `\n// not a comment\n/* nor this */\n`;\n') == (4, 0, 0)
+
+def test_block_comment_spans_lines():
+    assert counts('/*\n * header\n */\nbody { margin: 0; }\n', CSS) == (1, 3, 0)
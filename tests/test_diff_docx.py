@@ -0,0 +1,47 @@
+import time
+from collections import Counter
+
+from diff_docx import Paragraph, diff_paragraphs, patience_matches
+
+def paragraphs(texts, style='Normal'):
+    return [Paragraph(index, style, text, ()) for index, text in enumerate(texts)]
+
+def test_identical_sequences_match_everywhere():
+    assert patience_matches([1, 2, 3], [1, 2, 3]) == [(0, 0), (1, 1), (2, 2)]
+
+def test_unique_anchors_align_around_insertions():
+    assert patience_matches(['a', 'b', 'c'], ['a', 'x', 'b', 'y', 'c']) == [(0, 0), (1, 2), (2, 4)]
+
+def test_repeated_gap_uses_difflib_below_limit():
+    assert patience_matches(['x', 'x', 'y', 'x'], ['x', 'y', 'x']) == [(0, 0), (2, 1), (3, 2)]
+
+def test_large_gap_without_anchors_is_left_unmatched():
+    a = ['a', 'b'] * 5000
+    b = ['b', 'a'] * 5000
+    start = time.perf_counter()
+    skipped = []
+    assert patience_matches(a, b, skipped) == []
+    assert time.perf_counter() - start < 1
+    assert skipped == [(0, 10000, 0, 10000)]
+
+def test_unaligned_gap_is_deleted_and_inserted_not_moved():
+    old = paragraphs(['A', 'B'] * 600)
+    new = paragraphs(['B', 'A'] * 600)
+    changes, unchanged = diff_paragraphs(old, new)
+    assert unchanged == 0
+    assert Counter(change.kind for change in changes) == {'deleted': 1200, 'inserted': 1200}
+
+def test_moved_and_restyled_paragraphs():
+    old = paragraphs(['intro', 'moved', 'body', 'restyled', 'end'])
+    new = paragraphs(['intro', 'body', 'moved', 'restyled', 'end'])
+    new[3].style = 'Heading 2'
+    changes, unchanged = diff_paragraphs(old, new)
+    assert unchanged == 3
+    assert [(change.kind, change.new.text) for change in changes] == [('moved', 'moved'), ('restyled', 'restyled')]
+
+def test_changes_follow_the_alignment_on_both_sides():
+    old = paragraphs(['keep 1', 'gone', 'keep 2', 'keep 3'])
+    new = paragraphs(['added', 'added too', 'keep 1', 'keep 2', 'keep 3', 'tail'])
+    changes, _ = diff_paragraphs(old, new)
+    assert [(change.kind, (change.new or change.old).text) for change in changes] == [
+        ('inserted', 'added'), ('inserted', 'added too'), ('deleted', 'gone'), ('inserted', 'tail')]
@@ -0,0 +1,167 @@
+import io
+import os
+import shutil
+import struct
+import zipfile
+
+import pytest
+
+from docx_package import DocxPackage, repackage_docx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT = os.path.join(ROOT, 'IVARS-REPORT-FINAL.docx')
+
+class _Unseekable(io.RawIOBase):
+    """Write-only stream, so zipfile falls back to data descriptors"""
+
+    def __init__(self, target):
+        self.target = target
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.target.write(data)
+
+def streamed_zip(path, members):
+    """A zip whose members ({name: (bytes, compression)}) all use data descriptors"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(_Unseekable(buffer), 'w') as archive:
+        for name, (data, compression) in members.items():
+            archive.writestr(name, data, compress_type=compression)
+    with open(path, 'wb') as f:
+        f.write(buffer.getvalue())
+    return str(path)
+
+def raw_members(path):
+    """Compressed bytes of every member, read straight from the local headers"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    with zipfile.ZipFile(path) as archive:
+        raw = {}
+        for info in archive.infolist():
+            name_length, extra_length = struct.unpack('<2H', data[info.header_offset + 26:info.header_offset + 30])
+            start = info.header_offset + 30 + name_length + extra_length
+            raw[info.filename] = data[start:start + info.compress_size]
+        return raw
+
+def contents(path):
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        return {name: archive.read(name) for name in archive.namelist()}
+
+def test_untouched_members_are_copied_byte_for_byte(tmp_path):
+    output = str(tmp_path / 'report.docx')
+    document = contents(REPORT)['word/document.xml']
+    repackage_docx(REPORT, output, {'word/document.xml': document.replace(b'IVARS', b'IVARS2')})
+    before, after = raw_members(REPORT), raw_members(output)
+    assert list(after) == list(before)
+    for name in before:
+        if name != 'word/document.xml':
+            assert after[name] == before[name], name
+    new_contents = contents(output)
+    assert new_contents['word/document.xml'] == document.replace(b'IVARS', b'IVARS2')
+    assert {name: data for name, data in new_contents.items() if name != 'word/document.xml'} == {
+        name: data for name, data in contents(REPORT).items() if name != 'word/document.xml'}
+
+def test_data_descriptor_members(tmp_path):
+    source = streamed_zip(tmp_path / 'streamed.docx', {
+        '[Content_Types].xml': (b'<Types/>', zipfile.ZIP_DEFLATED),
+        'word/document.xml': (b'<document>old</document>' * 50, zipfile.ZIP_DEFLATED),
+        'word/media/image1.png': (bytes(range(256)) * 8, zipfile.ZIP_STORED),
+    })
+    with zipfile.ZipFile(source) as archive:
+        assert all(info.flag_bits & 0x08 for info in archive.infolist())
+    output = str(tmp_path / 'output.docx')
+    repackage_docx(source, output, {'word/document.xml': b'<document>new</document>'})
+    with zipfile.ZipFile(output) as archive:
+        assert not any(info.flag_bits & 0x08 for info in archive.infolist())
+        assert archive.getinfo('word/media/image1.png').compress_type == zipfile.ZIP_STORED
+    assert contents(output) == {
+        '[Content_Types].xml': b'<Types/>',
+        'word/document.xml': b'<document>new</document>',
+        'word/media/image1.png': bytes(range(256)) * 8,
+    }
+    assert raw_members(output)['word/media/image1.png'] == raw_members(source)['word/media/image1.png']
+
+def test_none_drops_a_member(tmp_path):
+    output = str(tmp_path / 'report.docx')
+    repackage_docx(REPORT, output, {'customXml/item1.xml': None})
+    original, repackaged = contents(REPORT), contents(output)
+    assert set(original) - set(repackaged) == {'customXml/item1.xml'}
+    assert all(repackaged[name] == original[name] for name in repackaged)
+
+def test_callable_streams_a_replacement(tmp_path):
+    output = str(tmp_path / 'report.docx')
+    chunks = [b'<w:document>', b'x' * 200_000, b'</w:document>']
+
+    def write(f):
+        for chunk in chunks:
+            f.write(chunk)
+
+    repackage_docx(REPORT, output, {'word/document.xml': write})
+    assert contents(output)['word/document.xml'] == b''.join(chunks)
+
+def test_output_may_be_the_source(tmp_path):
+    path = str(tmp_path / 'report.docx')
+    shutil.copy(REPORT, path)
+    original = contents(path)
+    repackage_docx(path, path, {'docProps/app.xml': b'<Properties/>'})
+    assert contents(path) == {**original, 'docProps/app.xml': b'<Properties/>'}
+    assert os.listdir(tmp_path) == ['report.docx']
+
+def data_offset(data, header_offset):
+    name_length, extra_length = struct.unpack('<2H', data[header_offset + 26:header_offset + 30])
+    return header_offset + 30 + name_length + extra_length
+
+def test_package_matches_zipfile_on_the_reports():
+    for name in ('IVARS-REPORT-FINAL.docx', 'IVARS-REPORT-UPDATED.docx', 'IVARS_COCOMO_Estimation.docx'):
+        path = os.path.join(ROOT, name)
+        with DocxPackage(path) as package, zipfile.ZipFile(path) as archive:
+            assert package.namelist() == archive.namelist()
+            for member in archive.namelist():
+                assert package.read(member) == archive.read(member), member
+
+def test_empty_and_stored_members(tmp_path):
+    path = tmp_path / 'stored.docx'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('empty.xml', b'', compress_type=zipfile.ZIP_DEFLATED)
+        archive.writestr('empty.bin', b'', compress_type=zipfile.ZIP_STORED)
+        archive.writestr('word/media/image1.png', bytes(range(256)) * 1000, compress_type=zipfile.ZIP_STORED)
+    with DocxPackage(str(path)) as package:
+        assert package.read('empty.xml') == b''
+        assert package.read('empty.bin') == b''
+        assert package.read('word/media/image1.png') == bytes(range(256)) * 1000
+        with package.open('word/media/image1.png') as stream:
+            assert stream.read(10) == bytes(range(10))
+        with pytest.raises(KeyError):
+            package.open('missing.xml')
+
+def test_truncated_packages_raise_bad_zip_file(tmp_path):
+    with open(REPORT, 'rb') as f:
+        data = f.read()
+    end_record = data[data.rindex(zipfile.stringEndArchive):]
+    for content in (b'', data[:100], data[:len(data) // 2], data[:-30],
+                    data[:1000] + data[len(data) // 2:], data[:1000] + end_record):
+        path = tmp_path / 'truncated.docx'
+        path.write_bytes(content)
+        with pytest.raises(zipfile.BadZipFile):
+            DocxPackage(str(path))
+
+def test_corrupt_members_raise_bad_zip_file(tmp_path):
+    path = tmp_path / 'corrupt.docx'
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr('stored.bin', bytes(range(256)) * 100, compress_type=zipfile.ZIP_STORED)
+        archive.writestr('header.xml', b'<w:document/>' * 1000, compress_type=zipfile.ZIP_DEFLATED)
+        archive.writestr('middle.xml', os.urandom(50_000).hex().encode(), compress_type=zipfile.ZIP_DEFLATED)
+        infos = archive.infolist()
+    data = bytearray(path.read_bytes())
+    # A changed stored byte and a deflate stream changed mid-way fail the CRC;
+    # a broken block header makes zlib itself give up
+    for info, position in zip(infos, (1000, 0, infos[2].compress_size // 2)):
+        data[data_offset(data, info.header_offset) + position] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with DocxPackage(str(path)) as package:
+        for info in infos:
+            with pytest.raises(zipfile.BadZipFile):
+                package.read(info.filename)
@@ -0,0 +1,61 @@
+import os
+import shutil
+import zipfile
+
+from docx_package import REL_TYPE_IMAGE, RELATIONSHIP, read_relationships, rels_source_part, resolve_target
+from media_docx import inventory_media, main, optimize_report
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def with_unused_copy(tmp_path, member, copy_name):
+    """IVARS-REPORT-FINAL.docx plus an unused member holding the same bytes as member"""
+    path = tmp_path / 'report.docx'
+    shutil.copy(os.path.join(ROOT, 'IVARS-REPORT-FINAL.docx'), path)
+    with zipfile.ZipFile(path) as archive:
+        data = archive.read(member)
+    with zipfile.ZipFile(path, 'a') as archive:
+        archive.writestr(copy_name, data)
+    return str(path)
+
+def image_targets(path):
+    with zipfile.ZipFile(path) as archive:
+        members = set(archive.namelist())
+        for rels_name, rels in read_relationships(archive).items():
+            for rel in rels.iter(RELATIONSHIP):
+                if rel.get('Type') == REL_TYPE_IMAGE and rel.get('TargetMode') != 'External':
+                    yield resolve_target(rels_source_part(rels_name), rel.get('Target')), members
+
+def test_used_copy_is_canonical(tmp_path):
+    path = with_unused_copy(tmp_path, 'word/media/image3.jpeg', 'word/media/image0.jpeg')
+    items, _ = inventory_media(path)
+    assert items['word/media/image0.jpeg'].duplicate_of == 'word/media/image3.jpeg'
+    assert items['word/media/image3.jpeg'].duplicate_of is None
+
+def test_drop_unused_keeps_duplicate_targets(tmp_path):
+    path = with_unused_copy(tmp_path, 'word/media/image3.jpeg', 'word/media/image0.jpeg')
+    output = str(tmp_path / 'optimized.docx')
+    result = optimize_report(path, output, drop_unused=True)
+    assert ('word/media/image4.jpeg', 'word/media/image3.jpeg') in [
+        (name, canonical) for name, canonical, _ in result.deduplicated]
+    for member, members in image_targets(output):
+        assert member in members
+    with zipfile.ZipFile(output) as archive:
+        assert archive.testzip() is None
+        assert 'word/media/image0.jpeg' not in archive.namelist()
+
+def test_optimize_refuses_to_overwrite_input(tmp_path, capsys):
+    path = with_unused_copy(tmp_path, 'word/media/image3.jpeg', 'word/media/image0.jpeg')
+    before = os.path.getsize(path)
+    assert main(['optimize', '-o', str(tmp_path), path]) == 1
+    assert 'Refusing to overwrite input' in capsys.readouterr().err
+    assert os.path.getsize(path) == before
+
+def test_dry_run_estimates_the_real_savings(tmp_path):
+    path = with_unused_copy(tmp_path, 'word/media/image3.jpeg', 'word/media/image0.jpeg')
+    planned = str(tmp_path / 'planned.docx')
+    estimate = optimize_report(path, planned, drop_unused=True, dry_run=True)
+    assert not os.path.exists(planned)
+    result = optimize_report(path, str(tmp_path / 'optimized.docx'), drop_unused=True)
+    saved = result.input_size - result.output_size
+    assert saved > 0
+    assert abs((estimate.input_size - estimate.output_size) - saved) < 256
@@ -0,0 +1,85 @@
+import os
+import shutil
+
+from docx import Document
+
+from read_docx import (
+    iter_tables,
+    load_search_index,
+    main,
+    save_search_index,
+    search_index,
+    tokenize,
+    update_search_index,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_tokenize_lowercases_and_keeps_percent():
+    assert tokenize('Response time under 3 min, 92% Ease-of-use') == [
+        'response', 'time', 'under', '3', 'min', '92%', 'ease', 'of', 'use']
+
+def test_tokenize_keeps_unicode_words():
+    assert tokenize('Cost ₹63 Lakhs — Überblick') == ['cost', '63', 'lakhs', 'überblick']
+
+def build_index(tmp_path):
+    report = tmp_path / 'cocomo.docx'
+    shutil.copy(os.path.join(ROOT, 'IVARS_COCOMO_Estimation.docx'), report)
+    index_path = str(tmp_path / '.report-index.json')
+    index = load_search_index(index_path)
+    update_search_index(index, [str(report)])
+    save_search_index(index_path, index)
+    return index_path, str(report)
+
+def search(index_path, *queries):
+    return [(heading, text) for _, _, heading, text in
+            search_index(index_path, load_search_index(index_path), list(queries))]
+
+def test_phrase_query_matches_consecutive_tokens(tmp_path):
+    index_path, _ = build_index(tmp_path)
+    hits = search(index_path, 'development time indicates')
+    assert len(hits) == 1
+    assert hits[0][0] == ['COCOMO Cost Estimation', 'Development Time Estimation']
+    assert search(index_path, 'time development indicates') == []
+
+def test_prefix_and_multiple_queries(tmp_path):
+    index_path, _ = build_index(tmp_path)
+    assert search(index_path, 'person-mon*')
+    assert all('organic' in text.lower() for _, text in search(index_path, 'organic', 'proj*'))
+
+def test_missing_parts_are_reindexed(tmp_path):
+    index_path, report = build_index(tmp_path)
+    shutil.rmtree(tmp_path / '.report-index')
+    index = load_search_index(index_path)
+    assert index['files'] == {}
+    indexed, _, _, _ = update_search_index(index, [report])
+    assert indexed == [os.path.abspath(report)]
+
+def test_refreshed_mtime_is_saved(tmp_path, capsys):
+    index_path, report = build_index(tmp_path)
+    os.utime(report, ns=(1_000_000_000, 1_000_000_000))
+    assert main(['index', report, '--index', index_path]) == 0
+    assert '0 indexed, 1 unchanged' in capsys.readouterr().out
+    entry = load_search_index(index_path)['files'][os.path.abspath(report)]
+    assert entry['mtime_ns'] == 1_000_000_000
+    _, unchanged, refreshed, _ = update_search_index(load_search_index(index_path), [report])
+    assert unchanged == [os.path.abspath(report)] and refreshed == []
+
+def test_caption_after_table_is_preferred():
+    captions = [table.caption for table in iter_tables(os.path.join(ROOT, 'IVARS_COCOMO_Estimation.docx'))]
+    assert captions[0] == 'Table 5.1: Project Size Estimation'
+    assert all(caption.startswith('Table 5.') for caption in captions)
+
+def test_caption_falls_back_to_preceding_paragraph(tmp_path):
+    doc = Document()
+    doc.add_paragraph('Figures by module')
+    doc.add_table(rows=1, cols=2).cell(0, 0).text = 'a'
+    doc.add_paragraph('')
+    doc.add_paragraph('Body text that follows the table')
+    doc.add_table(rows=1, cols=1)
+    doc.add_paragraph('Monthly totals', style='Caption')
+    path = tmp_path / 'tables.docx'
+    doc.save(path)
+    tables = list(iter_tables(str(path)))
+    assert [table.caption for table in tables] == ['Figures by module', 'Monthly totals']
+    assert tables[0].rows == [['a', '']]
@@ -0,0 +1,165 @@
+import os
+import zipfile
+
+import pytest
+
+from report_mapping import content_mapping
+from text_match import HeadingMatcher
+from update_docx import (
+    fragment_elements,
+    main,
+    render_markdown,
+    render_styles,
+    shared_keys,
+    stream_update_document,
+    update_document,
+)
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+# The bundled reports define no bullet or table style
+REPORT_STYLES = render_styles({'Normal': 'Normal', 'Body Text': 'BodyText', 'List Paragraph': 'ListParagraph'})
+WORD_STYLES = render_styles({'Normal': 'Normal', 'List Bullet': 'ListBullet', 'List Bullet 2': 'ListBullet2',
+                             'List Paragraph': 'ListParagraph', 'Table Grid': 'TableGrid'})
+
+REPORT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'IVARS-REPORT-UPDATED.docx')
+
+def test_exact_match_wins():
+    matcher = HeadingMatcher({'SCOPE': '', 'PROJECT SCOPE': ''})
+    assert matcher.match('Scope') == 'SCOPE'
+
+def test_longest_key_inside_heading():
+    matcher = HeadingMatcher({'SCOPE': '', 'PROJECT SCOPE': ''})
+    assert matcher.match('4.2 Project Scope and Limits') == 'PROJECT SCOPE'
+
+def test_key_must_fall_on_word_boundary():
+    matcher = HeadingMatcher({'SCOPE': ''})
+    assert matcher.match('TELESCOPE DESIGN') is None
+
+def test_heading_inside_longer_key_beats_shorter_contained_key():
+    matcher = HeadingMatcher({'SCOPE': '', 'CONCLUSION AND FUTURE SCOPE': ''})
+    assert matcher.match('FUTURE SCOPE') == 'CONCLUSION AND FUTURE SCOPE'
+
+def test_future_scope_with_report_mapping():
+    matcher = HeadingMatcher(content_mapping)
+    assert matcher.match('FUTURE SCOPE') == 'CONCLUSION AND FUTURE SCOPE'
+    assert matcher.match('SCOPE') == 'SCOPE'
+
+def test_ties_fall_back_to_mapping_order():
+    matcher = HeadingMatcher({'ALPHA TESTING': '', 'ALPHA RESULTS': ''})
+    assert matcher.match('ALPHA') == 'ALPHA TESTING'
+
+def test_shared_keys_lists_every_claiming_heading():
+    matcher = HeadingMatcher(content_mapping)
+    headings = ['INTRODUCTION', 'CONCLUSION', 'FUTURE SCOPE']
+    sections = [(heading, matcher.match(heading)) for heading in headings]
+    assert shared_keys(sections) == {'CONCLUSION AND FUTURE SCOPE': ['CONCLUSION', 'FUTURE SCOPE']}
+
+def test_streamed_document_matches_dom_update(tmp_path):
+    dom_path, stream_path = tmp_path / 'dom.docx', tmp_path / 'stream.docx'
+    update_document(REPORT, str(dom_path), content_mapping)
+    stream_update_document(REPORT, str(stream_path), content_mapping)
+    with zipfile.ZipFile(dom_path) as dom, zipfile.ZipFile(stream_path) as stream:
+        dom_xml, stream_xml = dom.read('word/document.xml'), stream.read('word/document.xml')
+    assert stream_xml == dom_xml
+    assert stream_xml.count(b'xmlns') == dom_xml.count(b'xmlns')
+
+@pytest.mark.parametrize('stream', [False, True])
+def test_second_in_place_update_leaves_the_file_untouched(tmp_path, capsys, stream):
+    options = ['-j', '1', '--cache-dir', str(tmp_path / 'cache')] + (['--stream'] if stream else [])
+    assert main(['update', REPORT, '-o', str(tmp_path / 'out')] + options) == 0
+    path = tmp_path / 'out' / os.path.basename(REPORT)
+    # An old mtime, so any rewrite would show up even on a coarse clock
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    before = path.read_bytes()
+    capsys.readouterr()
+    assert main(['update', str(path), '--in-place'] + options) == 0
+    row = next(line for line in capsys.readouterr().out.splitlines() if line.startswith(path.name))
+    _, matched, rewritten, _, status = row.split()
+    assert int(matched) > 0 and rewritten == '0' and status == 'unchanged'
+    assert path.read_bytes() == before
+    assert path.stat().st_mtime_ns == 1_000_000_000
+
+def test_plan_does_not_write_the_fragment_cache(tmp_path, capsys):
+    cache_dir = tmp_path / 'cache'
+    assert main(['update', REPORT, '--plan', '--cache-dir', str(cache_dir), '-j', '1']) == 0
+    assert not cache_dir.exists()
+    assert main(['update', REPORT, '-o', str(tmp_path / 'out'), '--cache-dir', str(cache_dir), '-j', '1']) == 0
+    cached = sorted(cache_dir.iterdir())
+    assert cached
+    for path in cached:
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    assert main(['update', REPORT, '--plan', '--cache-dir', str(cache_dir), '-j', '1']) == 0
+    assert sorted(cache_dir.iterdir()) == cached
+    assert all(path.stat().st_mtime_ns == 1_000_000_000 for path in cached)
+
+def render(text, styles=REPORT_STYLES):
+    return fragment_elements(render_markdown(text, styles))
+
+def text_of(element):
+    return ''.join(t.text for t in element.iter(f'{W}t'))
+
+def style_of(paragraph):
+    return paragraph.find(f'{W}pPr/{W}pStyle').get(f'{W}val')
+
+def indent_of(paragraph):
+    indent = paragraph.find(f'{W}pPr/{W}ind')
+    return None if indent is None else int(indent.get(f'{W}left'))
+
+def test_blank_lines_split_paragraphs_and_lines_break():
+    blocks = render('First line\nsecond line\n\nNext paragraph')
+    assert [text_of(block) for block in blocks] == ['First linesecond line', 'Next paragraph']
+    assert len(blocks[0].findall(f'{W}r/{W}br')) == 1
+    assert {style_of(block) for block in blocks} == {'BodyText'}
+
+def test_inline_markup():
+    runs = render('**Bold** and *italic* with `code`')[0].findall(f'{W}r')
+    assert [(text_of(run), run.find(f'{W}rPr/{W}b') is not None, run.find(f'{W}rPr/{W}i') is not None)
+            for run in runs] == [('Bold', True, False), (' and ', False, False), ('italic', False, True),
+                                 (' with ', False, False), ('code', False, False)]
+    assert runs[-1].find(f'{W}rPr/{W}rFonts') is not None
+
+def test_spaced_asterisks_are_not_italic():
+    paragraph = render('5 * 3 and 4 * 2')[0]
+    assert text_of(paragraph) == '5 * 3 and 4 * 2'
+    assert paragraph.find(f'.//{W}i') is None
+
+def test_bullets_without_a_bullet_style_get_glyphs_and_indents():
+    items = render('- top\n  - nested\n    - deeper\n  - back\n- again')
+    assert [text_of(item) for item in items] == ['\u2022 top', '\u25e6 nested', '\u25aa deeper',
+                                                  '\u25e6 back', '\u2022 again']
+    assert {style_of(item) for item in items} == {'ListParagraph'}
+    assert [indent_of(item) for item in items] == [None, 1440, 2160, 1440, None]
+
+def test_bullets_with_word_list_styles():
+    items = render('- top\n  - nested\n    - deeper', WORD_STYLES)
+    assert [text_of(item) for item in items] == ['top', 'nested', 'deeper']
+    assert [style_of(item) for item in items] == ['ListBullet', 'ListBullet2', 'ListBullet']
+    assert [indent_of(item) for item in items] == [None, None, 2160]
+
+def test_numbered_items_keep_their_numbers():
+    items = render('Steps:\n\n1. Report\n2. Verify\n   1. Call back\n3. Dispatch')
+    assert [text_of(item) for item in items[1:]] == ['1. Report', '2. Verify', '1. Call back', '3. Dispatch']
+    assert [indent_of(item) for item in items[1:]] == [None, None, 1440, None]
+
+def test_fenced_code_keeps_indentation_and_markup():
+    blocks = render('Before\n\n```\nif (a) {\n    **b**;\n}\n```\nAfter')
+    assert [text_of(block) for block in blocks] == ['Before', 'if (a) {    **b**;}', 'After']
+    code = blocks[1]
+    assert len(code.findall(f'{W}r/{W}br')) == 2
+    assert all(run.find(f'{W}rPr/{W}rFonts') is not None for run in code.findall(f'{W}r/{W}rPr/..'))
+
+def table_properties(table):
+    return [child.tag.removeprefix(W) for child in table.find(f'{W}tblPr')]
+
+def test_pipe_table_without_table_style():
+    [table] = render('| Module | LOC |\n|---|---:|\n| Backend | **1,715** |\n| Frontend |')
+    assert table.tag == f'{W}tbl'
+    assert table_properties(table) == ['tblW', 'tblBorders']
+    rows = [[text_of(cell) for cell in row.findall(f'{W}tc')] for row in table.findall(f'{W}tr')]
+    assert rows == [['Module', 'LOC'], ['Backend', '1,715'], ['Frontend', '']]
+    assert all(run.find(f'{W}rPr/{W}b') is not None for run in table.find(f'{W}tr').iter(f'{W}r'))
+    assert len(table.findall(f'{W}tblGrid/{W}gridCol')) == 2
+
+def test_pipe_table_with_table_style():
+    [table] = render('| A | B |\n|---|---|\n| 1 | 2 |', WORD_STYLES)
+    assert table_properties(table) == ['tblStyle', 'tblW']
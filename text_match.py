@@ -0,0 +1,147 @@
+import re
+from bisect import bisect_right
+from collections import deque
+
+def on_word_boundary(text, start, end):
+    """Check that text[start:end] is not part of a longer word"""
+    return ((start == 0 or not text[start - 1].isalnum())
+            and (end == len(text) or not text[end].isalnum()))
+
+class PatternAutomaton:
+    """Aho-Corasick automaton finding many patterns in one scan of a text"""
+
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        goto = [{}]
+        output = [[]]
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                if char not in goto[state]:
+                    goto.append({})
+                    output.append([])
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            output[state].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, target in goto[state].items():
+                queue.append(target)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[target] = goto[fallback].get(char, 0)
+                if fail[target] == target:
+                    fail[target] = 0
+                output[target] = output[target] + output[fail[target]]
+
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+
+    def finditer(self, text):
+        """Yield (start, end, pattern index) for every occurrence, overlaps included"""
+        goto, fail, output, patterns = self._goto, self._fail, self._output, self.patterns
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                yield end - len(patterns[index]), end, index
+
+CHAPTER_PREFIX = re.compile(r'CHAPTER\s+\d+', flags=re.IGNORECASE)
+
+def extract_heading_text(text):
+    """Extract clean heading text, removing CHAPTER numbers"""
+    # Remove "CHAPTER X" prefix and collapse runs of whitespace
+    text = CHAPTER_PREFIX.sub('', text)
+    return ' '.join(text.split()).upper()
+
+class HeadingMatcher:
+    """Resolve section headings to content_mapping keys.
+
+    Built once per mapping. Keys and headings are compared after
+    extract_heading_text() normalization:
+
+    1. An exact match on the normalized heading wins outright.
+    2. Otherwise candidates are keys contained in the heading (found with
+       one Aho-Corasick scan) and, for headings of at least
+       MIN_PARTIAL_LENGTH characters, keys containing the heading. They
+       are ranked together: the longest matched text wins, then the
+       earliest position in the heading, then the shortest key, then
+       mapping order. So "FUTURE SCOPE" resolves to "CONCLUSION AND
+       FUTURE SCOPE" rather than "SCOPE".
+
+    Substring matches must fall on word boundaries, so "SCOPE" never
+    matches inside "TELESCOPE".
+    """
+
+    MIN_PARTIAL_LENGTH = 4
+
+    def __init__(self, mapping):
+        self.keys = list(mapping)
+        self._normalized = [extract_heading_text(key) for key in self.keys]
+        self._exact = {}
+        for index, normalized in enumerate(self._normalized):
+            self._exact.setdefault(normalized, index)
+        self._cache = {}
+        self._automaton = PatternAutomaton(self._normalized)
+        self._build_key_text()
+
+    def _build_key_text(self):
+        """Join the normalized keys so heading-in-key lookups are one find()"""
+        self._key_offsets = []
+        offset = 0
+        for normalized in self._normalized:
+            self._key_offsets.append(offset)
+            offset += len(normalized) + 1
+        self._key_text = '\n'.join(self._normalized)
+
+    def _keys_in_heading(self, heading):
+        """Return the rank of the best key occurring inside heading, or None"""
+        best = None
+        for start, end, index in self._automaton.finditer(heading):
+            if not on_word_boundary(heading, start, end):
+                continue
+            length = len(self._normalized[index])
+            rank = (-length, start, length, index)
+            if best is None or rank < best:
+                best = rank
+        return best
+
+    def _heading_in_keys(self, heading):
+        """Return the rank of the best key containing heading, or None"""
+        if len(heading) < self.MIN_PARTIAL_LENGTH:
+            return None
+        best = None
+        position = self._key_text.find(heading)
+        while position != -1:
+            index = bisect_right(self._key_offsets, position) - 1
+            normalized = self._normalized[index]
+            start = position - self._key_offsets[index]
+            if on_word_boundary(normalized, start, start + len(heading)):
+                rank = (-len(heading), 0, len(normalized), index)
+                if best is None or rank < best:
+                    best = rank
+            position = self._key_text.find(heading, position + 1)
+        return best
+
+    def match(self, heading_text):
+        """Return the mapping key for heading_text, or None"""
+        heading = extract_heading_text(heading_text)
+        if heading not in self._cache:
+            index = None
+            if heading:
+                index = self._exact.get(heading)
+                if index is None:
+                    ranks = [rank for rank in (self._keys_in_heading(heading), self._heading_in_keys(heading))
+                             if rank is not None]
+                    index = min(ranks)[-1] if ranks else None
+            self._cache[heading] = None if index is None else self.keys[index]
+        return self._cache[heading]